@@ -0,0 +1,1153 @@
+# Spline math shared by the curve operators. Keep this module free of bpy and mathutils
+# so it can be imported by worker processes and plain Python interpreters.
+import gzip
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import struct
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+EPS = 1.0e-9
+ARRAY_FIT_MIN_POINTS = 16
+ARRAY_SIMPLIFY_MIN_POINTS = 64
+# Turns sharper than this split a polyline into separately fitted runs
+POLY_CORNER_ANGLE = math.radians(40.0)
+FIT_CACHE_FORMAT = 1
+# Smallest Blender-space distance kept when optimized path data is quantized (0.1 mm)
+PATH_RESOLUTION = 1.0e-4
+
+PATH_COMMAND_RE = re.compile(r"([AaCcHhLlMmQqSsTtVvZz])([^AaCcHhLlMmQqSsTtVvZz]*)")
+PATH_NUMBER_RE = re.compile(r"[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?")
+
+
+def vadd(a, b):
+    return tuple(x + y for x, y in zip(a, b))
+
+
+def vsub(a, b):
+    return tuple(x - y for x, y in zip(a, b))
+
+
+def vmul(a, s):
+    return tuple(x * s for x in a)
+
+
+def vdot(a, b):
+    return sum(x * y for x, y in zip(a, b))
+
+
+def vlen(a):
+    return math.sqrt(max(0.0, vdot(a, a)))
+
+
+def vnorm(a):
+    length = vlen(a)
+    if length < EPS:
+        return tuple(0.0 for _ in a)
+    return vmul(a, 1.0 / length)
+
+
+def vlerp(a, b, t):
+    return tuple((1.0 - t) * x + t * y for x, y in zip(a, b))
+
+
+def is_same_point(a, b, eps=1.0e-7):
+    return vlen(vsub(a, b)) <= eps
+
+
+def bezier_point(p0, p1, p2, p3, t):
+    u = 1.0 - t
+    return vadd(
+        vadd(vmul(p0, u * u * u), vmul(p1, 3.0 * u * u * t)),
+        vadd(vmul(p2, 3.0 * u * t * t), vmul(p3, t * t * t)),
+    )
+
+
+def chord_parameters(points):
+    distances = [0.0]
+    total = 0.0
+    for i in range(1, len(points)):
+        total += vlen(vsub(points[i], points[i - 1]))
+        distances.append(total)
+    if total < EPS:
+        return [i / max(1, len(points) - 1) for i in range(len(points))]
+    return [d / total for d in distances]
+
+
+def generate_bezier(points, params, left_tangent, right_tangent):
+    p0 = points[0]
+    p3 = points[-1]
+    c00 = c01 = c11 = x0 = x1 = 0.0
+
+    for point, u in zip(points, params):
+        b0 = (1.0 - u) ** 3
+        b1 = 3.0 * u * (1.0 - u) ** 2
+        b2 = 3.0 * u * u * (1.0 - u)
+        b3 = u ** 3
+        a1 = vmul(left_tangent, b1)
+        a2 = vmul(right_tangent, b2)
+        tmp = vsub(point, vadd(vmul(p0, b0 + b1), vmul(p3, b2 + b3)))
+        c00 += vdot(a1, a1)
+        c01 += vdot(a1, a2)
+        c11 += vdot(a2, a2)
+        x0 += vdot(a1, tmp)
+        x1 += vdot(a2, tmp)
+
+    det = c00 * c11 - c01 * c01
+    alpha_l = alpha_r = 0.0
+    if abs(det) > EPS:
+        alpha_l = (x0 * c11 - x1 * c01) / det
+        alpha_r = (c00 * x1 - c01 * x0) / det
+
+    seg_len = vlen(vsub(p3, p0))
+    if alpha_l < EPS or alpha_r < EPS:
+        alpha_l = alpha_r = seg_len / 3.0
+
+    return (p0, vadd(p0, vmul(left_tangent, alpha_l)), vadd(p3, vmul(right_tangent, alpha_r)), p3)
+
+
+def max_bezier_error(points, curve, params):
+    max_error = -1.0
+    split = len(points) // 2
+    for i in range(1, len(points) - 1):
+        error = vlen(vsub(bezier_point(*curve, params[i]), points[i]))
+        if error > max_error:
+            max_error = error
+            split = i
+    return max_error, split
+
+
+def fit_cubic_recursive(points, left_tangent, right_tangent, tolerance, out_segments, depth=0):
+    if len(points) == 2:
+        dist = vlen(vsub(points[1], points[0])) / 3.0
+        out_segments.append((points[0], vadd(points[0], vmul(left_tangent, dist)), vadd(points[1], vmul(right_tangent, dist)), points[1]))
+        return
+
+    params = chord_parameters(points)
+    curve = generate_bezier(points, params, left_tangent, right_tangent)
+    error, split = max_bezier_error(points, curve, params)
+    if error <= tolerance or depth >= 24:
+        out_segments.append(curve)
+        return
+
+    center = vnorm(vsub(points[split + 1], points[split - 1]))
+    if vlen(center) < EPS:
+        center = left_tangent
+    fit_cubic_recursive(points[: split + 1], left_tangent, vmul(center, -1.0), tolerance, out_segments, depth + 1)
+    fit_cubic_recursive(points[split:], center, right_tangent, tolerance, out_segments, depth + 1)
+
+
+def bernstein_basis(params):
+    u = np.asarray(params, dtype=np.float64)
+    v = 1.0 - u
+    return np.stack((v * v * v, 3.0 * u * v * v, 3.0 * u * u * v, u * u * u), axis=1)
+
+
+def bezier_points_array(curve, params):
+    return bernstein_basis(params) @ curve
+
+
+def array_norm(a):
+    length = float(np.sqrt(max(0.0, np.dot(a, a))))
+    if length < EPS:
+        return np.zeros_like(a)
+    return a / length
+
+
+def chord_parameters_array(points):
+    distances = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))))
+    total = distances[-1]
+    if total < EPS:
+        return np.arange(len(points), dtype=np.float64) / max(1, len(points) - 1)
+    return distances / total
+
+
+def generate_bezier_array(points, params, left_tangent, right_tangent):
+    p0 = points[0]
+    p3 = points[-1]
+    b0, b1, b2, b3 = bernstein_basis(params).T
+    tmp = points - np.outer(b0 + b1, p0) - np.outer(b2 + b3, p3)
+    c00 = float(np.dot(b1, b1) * np.dot(left_tangent, left_tangent))
+    c01 = float(np.dot(b1, b2) * np.dot(left_tangent, right_tangent))
+    c11 = float(np.dot(b2, b2) * np.dot(right_tangent, right_tangent))
+    x0 = float(np.dot(b1, tmp @ left_tangent))
+    x1 = float(np.dot(b2, tmp @ right_tangent))
+
+    det = c00 * c11 - c01 * c01
+    alpha_l = alpha_r = 0.0
+    if abs(det) > EPS:
+        alpha_l = (x0 * c11 - x1 * c01) / det
+        alpha_r = (c00 * x1 - c01 * x0) / det
+
+    seg_len = float(np.linalg.norm(p3 - p0))
+    if alpha_l < EPS or alpha_r < EPS:
+        alpha_l = alpha_r = seg_len / 3.0
+
+    return np.array((p0, p0 + left_tangent * alpha_l, p3 + right_tangent * alpha_r, p3))
+
+
+def max_bezier_error_array(points, curve, params):
+    if len(points) < 3:
+        return -1.0, len(points) // 2
+    errors = np.linalg.norm(bezier_points_array(curve, params[1:-1]) - points[1:-1], axis=1)
+    index = int(np.argmax(errors))
+    return float(errors[index]), index + 1
+
+
+def fit_cubic_recursive_array(points, left_tangent, right_tangent, tolerance, out_segments, depth=0):
+    if len(points) == 2:
+        dist = float(np.linalg.norm(points[1] - points[0])) / 3.0
+        out_segments.append(np.array((points[0], points[0] + left_tangent * dist, points[1] + right_tangent * dist, points[1])))
+        return
+
+    params = chord_parameters_array(points)
+    curve = generate_bezier_array(points, params, left_tangent, right_tangent)
+    error, split = max_bezier_error_array(points, curve, params)
+    if error <= tolerance or depth >= 24:
+        out_segments.append(curve)
+        return
+
+    center = array_norm(points[split + 1] - points[split - 1])
+    if float(np.dot(center, center)) < EPS * EPS:
+        center = left_tangent
+    fit_cubic_recursive_array(points[: split + 1], left_tangent, -center, tolerance, out_segments, depth + 1)
+    fit_cubic_recursive_array(points[split:], center, right_tangent, tolerance, out_segments, depth + 1)
+
+
+def fit_cubic(points, tolerance=0.01, cyclic=False, use_array=True):
+    clean = []
+    for p in points:
+        if not clean or not is_same_point(clean[-1], p):
+            clean.append(tuple(float(v) for v in p))
+    if len(clean) < 2:
+        return []
+    if cyclic and not is_same_point(clean[0], clean[-1]):
+        clean.append(clean[0])
+
+    segments = []
+    if use_array and np is not None and len(clean) >= ARRAY_FIT_MIN_POINTS:
+        array = np.array(clean, dtype=np.float64)
+        left = array_norm(array[1] - array[0])
+        right = array_norm(array[-2] - array[-1])
+        fit_cubic_recursive_array(array, left, right, max(tolerance, 1.0e-5), segments)
+        return [tuple(tuple(p) for p in seg.tolist()) for seg in segments]
+
+    left = vnorm(vsub(clean[1], clean[0]))
+    right = vnorm(vsub(clean[-2], clean[-1]))
+    fit_cubic_recursive(clean, left, right, max(tolerance, 1.0e-5), segments)
+    return segments
+
+
+def point_segment_distance(p, a, b):
+    abx = b[0] - a[0]
+    aby = b[1] - a[1]
+    length_sq = abx * abx + aby * aby
+    t = 0.0
+    if length_sq > EPS * EPS:
+        t = min(1.0, max(0.0, ((p[0] - a[0]) * abx + (p[1] - a[1]) * aby) / length_sq))
+    return math.hypot(p[0] - a[0] - t * abx, p[1] - a[1] - t * aby)
+
+
+def segment_distances_array(xy, a, b):
+    ab = b - a
+    length_sq = float(ab @ ab)
+    if length_sq < EPS * EPS:
+        return np.linalg.norm(xy - a, axis=1)
+    t = np.clip((xy - a) @ ab / length_sq, 0.0, 1.0)
+    return np.linalg.norm(xy - a - np.outer(t, ab), axis=1)
+
+
+def simplify_polyline_indices(points, tolerance=0.0, cyclic=False):
+    # Ramer-Douglas-Peucker in the SVG (XY) plane with an explicit stack instead of recursion.
+    # Closed polylines are simplified as an open run back to the first point.
+    count = len(points)
+    if tolerance <= 0.0 or count < 3:
+        return list(range(count))
+    last_index = count if cyclic else count - 1
+    keep = [False] * (last_index + 1)
+    keep[0] = keep[last_index] = True
+    stack = [(0, last_index)]
+    if np is not None and count >= ARRAY_SIMPLIFY_MIN_POINTS:
+        xy = np.array([(p[0], p[1]) for p in points], dtype=np.float64)
+        if cyclic:
+            xy = np.vstack((xy, xy[:1]))
+        while stack:
+            first, last = stack.pop()
+            if last - first < 2:
+                continue
+            distances = segment_distances_array(xy[first + 1:last], xy[first], xy[last])
+            index = int(np.argmax(distances))
+            if distances[index] > tolerance:
+                split = first + 1 + index
+                keep[split] = True
+                stack.append((first, split))
+                stack.append((split, last))
+    else:
+        while stack:
+            first, last = stack.pop()
+            a = points[first]
+            b = points[last % count]
+            split = -1
+            max_distance = tolerance
+            for i in range(first + 1, last):
+                distance = point_segment_distance(points[i], a, b)
+                if distance > max_distance:
+                    max_distance = distance
+                    split = i
+            if split >= 0:
+                keep[split] = True
+                stack.append((first, split))
+                stack.append((split, last))
+    return [i for i in range(count) if keep[i]]
+
+
+def simplify_polyline(points, tolerance=0.0, cyclic=False):
+    return [points[i] for i in simplify_polyline_indices(points, tolerance, cyclic)]
+
+
+def fit_polyline_run(run, tolerance=0.01, samples=8):
+    # fit_cubic only measures error at the vertices, so noisy runs can leave a kinked segment bulging between
+    # them. Segments that stray from their stretch of the polyline fall back to its straight edges.
+    segments = []
+    start = 0
+    for segment in fit_cubic(run, tolerance):
+        end = start + 1
+        while end < len(run) - 1 and tuple(float(v) for v in run[end]) != segment[3]:
+            end += 1
+        edges = list(zip(run[start:end], run[start + 1:end + 1]))
+        if all(
+            min(point_segment_distance(bezier_point(*segment, i / samples), a, b) for a, b in edges) <= tolerance
+            for i in range(1, samples)
+        ):
+            segments.append(segment)
+        else:
+            segments.extend((a, vlerp(a, b, 1.0 / 3.0), vlerp(a, b, 2.0 / 3.0), b) for a, b in edges)
+        start = end
+    return segments
+
+
+def fit_polyline(points, tolerance=0.01, cyclic=False, corner_angle=POLY_CORNER_ANGLE):
+    # Fits the simplified outline rather than the raw samples, whose noise would throw off fit_cubic's
+    # tangents. Half the tolerance goes to each stage so the result stays within tolerance of the input.
+    kept = simplify_polyline(points, 0.5 * tolerance, cyclic)
+    count = len(kept)
+    if count < 2:
+        return []
+    limit = math.cos(corner_angle)
+    corners = []
+    for i in range(count) if cyclic else range(1, count - 1):
+        before = vnorm(vsub(kept[i], kept[i - 1]))
+        after = vnorm(vsub(kept[(i + 1) % count], kept[i]))
+        if vdot(before, after) < limit:
+            corners.append(i)
+    if not cyclic:
+        bounds = [0] + corners + [count - 1]
+        runs = [kept[a:b + 1] for a, b in zip(bounds, bounds[1:])]
+    elif not corners:
+        runs = [kept + [kept[0]]]
+    else:
+        loop = kept[corners[0]:] + kept[:corners[0]] + [kept[corners[0]]]
+        bounds = [index - corners[0] for index in corners] + [count]
+        runs = [loop[a:b + 1] for a, b in zip(bounds, bounds[1:])]
+    segments = []
+    for run in runs:
+        segments.extend(fit_polyline_run(run, 0.5 * tolerance))
+    return segments
+
+
+def bezier_knot_vector(count, degree, endpoint=False, cyclic=False):
+    # Port of Blender's calcknots() for "Bezier" knot mode: inner knots repeat degree times so every
+    # degree control points past the first form one Bezier segment
+    order = degree + 1
+    head = (order - (1 if cyclic else 0)) if endpoint else min(2, degree)
+    tail = 2 * order - 1 if cyclic else (order if endpoint else 0)
+    knot_count = count + order + (degree if cyclic else 0)
+    knots = [0.0] * knot_count
+    offset = 1 if endpoint and cyclic else 0
+    current = float(offset)
+    repeat = head
+    for i in range(offset, knot_count - tail):
+        knots[i] = current
+        repeat -= 1
+        if repeat == 0:
+            current += 1.0
+            repeat = degree
+    for i in range(tail):
+        knots[knot_count - tail + i] = current + knots[i] - knots[0]
+    return knots, knots[degree], knots[count + (degree if cyclic else 0)]
+
+
+def make_knot_vector(count, degree, endpoint=False, cyclic=False, bezier=False):
+    if bezier:
+        return bezier_knot_vector(count, degree, endpoint, cyclic)
+    if cyclic:
+        total = count + degree
+        return [float(i) for i in range(total + degree + 1)], float(degree), float(count + degree)
+    if endpoint:
+        interior = max(0, count - degree - 1)
+        return [0.0] * (degree + 1) + [float(i + 1) for i in range(interior)] + [float(interior + 1)] * (degree + 1), 0.0, float(interior + 1)
+    knots = [float(i) for i in range(count + degree + 1)]
+    return knots, float(degree), float(count)
+
+
+def deboor_rational(control, degree, knots, u):
+    n = len(control) - 1
+    if u >= knots[n + 1]:
+        span = n
+    else:
+        span = degree
+        for i in range(degree, n + 1):
+            if knots[i] <= u < knots[i + 1]:
+                span = i
+                break
+
+    d = []
+    for j in range(degree + 1):
+        point, weight = control[span - degree + j]
+        d.append([point[k] * weight for k in range(len(point))] + [weight])
+
+    for r in range(1, degree + 1):
+        for j in range(degree, r - 1, -1):
+            i = span - degree + j
+            denom = knots[i + degree + 1 - r] - knots[i]
+            alpha = 0.0 if abs(denom) < EPS else (u - knots[i]) / denom
+            d[j] = [(1.0 - alpha) * d[j - 1][k] + alpha * d[j][k] for k in range(len(d[j]))]
+
+    w = d[degree][-1]
+    if abs(w) < EPS:
+        return tuple(d[degree][:-1])
+    return tuple(v / w for v in d[degree][:-1])
+
+
+def evaluate_nurbs_control(control, order, cyclic=False, endpoint=False, samples=None, bezier=False):
+    count = len(control)
+    if count < 2:
+        return []
+    degree = max(1, min(int(order) - 1, count - 1))
+    if cyclic:
+        control = control + control[:degree]
+    knots, start, end = make_knot_vector(count, degree, bool(endpoint), bool(cyclic), bool(bezier))
+    sample_count = samples or max(24, count * max(8, int(order) * 6))
+    pts = []
+    for i in range(sample_count + 1):
+        u = start + (end - start) * (i / sample_count)
+        pts.append(deboor_rational(control, degree, knots, u))
+    return pts
+
+
+def control_weights_equal(control):
+    if not control:
+        return True
+    first = control[0][1]
+    return all(abs(weight - first) < 1.0e-6 for _point, weight in control)
+
+
+def bezier_knot_segments(control, cyclic=False):
+    # Control points of an order 4 "Bezier" knot NURBS, read straight off as cubic segments.
+    # Open splines are laid out [a0, r0, l1, a1, ...], cyclic ones [l0, a0, r0, l1, a1, r1, ...].
+    points = [point for point, _weight in control]
+    if cyclic:
+        points = points[1:] + points[:2]
+    return [tuple(points[i:i + 4]) for i in range(0, len(points) - 3, 3)]
+
+
+def fit_nurbs_control(control, order, cyclic=False, endpoint=False, tolerance=0.01, bezier=False):
+    if (
+        bezier and int(order) == 4 and control_weights_equal(control)
+        and (len(control) % 3 == 0 if cyclic else endpoint and len(control) % 3 == 1)
+    ):
+        return bezier_knot_segments(control, bool(cyclic)), bool(cyclic)
+    direct_possible = int(order) < 4 and control_weights_equal(control)
+    samples = evaluate_nurbs_control(control, order, cyclic, endpoint, bezier=bezier)
+    tol = tolerance * (0.25 if direct_possible else 1.0)
+    return fit_cubic(samples, tol, bool(cyclic)), bool(cyclic)
+
+
+def fit_cache_key(control, order, cyclic=False, endpoint=False, tolerance=0.01, bezier=False):
+    # Control points are already in world space, so the key covers the object matrix as well
+    flat = [v for point, weight in control for v in (*point, weight)]
+    digest = hashlib.sha1(struct.pack("<iii??d", FIT_CACHE_FORMAT, len(control), int(order), bool(cyclic), bool(endpoint), float(tolerance)))
+    if bezier:
+        # Only tagged when set so keys stored before the knot mode was tracked stay valid
+        digest.update(b"bezier")
+    digest.update(struct.pack(f"<{len(flat)}d", *flat))
+    return digest.hexdigest()
+
+
+def parse_fit_cache_entry(value):
+    # [segments, cyclic] with every segment four 2D or 3D points, raises TypeError/ValueError otherwise
+    segments, cyclic = value
+    if not isinstance(segments, list) or not isinstance(cyclic, bool):
+        raise TypeError("fit cache entry must be [segments, cyclic]")
+    result = []
+    for seg in segments:
+        if not isinstance(seg, list) or len(seg) != 4:
+            raise ValueError("fit cache segment must have four points")
+        points = []
+        for p in seg:
+            if not isinstance(p, list) or len(p) not in (2, 3):
+                raise ValueError("fit cache point must have two or three coordinates")
+            points.append(tuple(float(v) for v in p))
+        result.append(tuple(points))
+    return result, cyclic
+
+
+class FitCache:
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+    def get(self, key):
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def store(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        self.dirty = True
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, filepath):
+        try:
+            with open(filepath, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return 0
+        if not isinstance(data, dict) or data.get("format") != FIT_CACHE_FORMAT:
+            return 0
+        # Any entry of the wrong shape makes the whole file a miss, a damaged cache must never fail an export
+        try:
+            parsed = {key: parse_fit_cache_entry(value) for key, value in data["entries"].items()}
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return 0
+        loaded = 0
+        for key, result in parsed.items():
+            if key in self.entries:
+                continue
+            self.entries[key] = result
+            self.entries.move_to_end(key, last=False)
+            loaded += 1
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return loaded
+
+    def save(self, filepath):
+        payload = {"format": FIT_CACHE_FORMAT, "entries": {key: [segments, cyclic] for key, (segments, cyclic) in self.entries.items()}}
+        temp_path = filepath + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(temp_path, filepath)
+        self.dirty = False
+
+
+@dataclass
+class SvgSubpath:
+    kind: str
+    points: list
+    segments: list
+    cyclic: bool = False
+
+
+@dataclass
+class SvgInstanceGroup:
+    # transforms[i] places the shape where the object at export position positions[i] was
+    shape_id: str
+    transforms: list
+    scale: float = 1.0
+    positions: list = field(default_factory=list)
+
+
+def svg_to_blender(p):
+    return (float(p[0]), -float(p[1]), 0.0)
+
+
+def svg_xy(point, scale=1.0):
+    return point[0] * scale, -point[1] * scale
+
+
+def reflect(point, around):
+    return (2.0 * around[0] - point[0], 2.0 * around[1] - point[1])
+
+
+def tokenize_path_data(d):
+    # Single scan over d, each match is one command letter plus the text of its arguments.
+    # Numbers ahead of the first command are reported with a None command.
+    first = True
+    for match in PATH_COMMAND_RE.finditer(d):
+        if first:
+            first = False
+            if PATH_NUMBER_RE.search(d, 0, match.start()):
+                yield None, []
+                return
+        yield match.group(1), list(map(float, PATH_NUMBER_RE.findall(match.group(2))))
+    if first:
+        yield None, []
+
+
+def line_thirds(p0, p3):
+    # Same arithmetic as vlerp(p0, p3, 1 / 3) and vlerp(p0, p3, 2 / 3), inlined for the parser hot path
+    t1 = 1 / 3
+    t2 = 2 / 3
+    s1 = 1.0 - t1
+    s2 = 1.0 - t2
+    return (
+        (s1 * p0[0] + t1 * p3[0], s1 * p0[1] + t1 * p3[1], s1 * p0[2] + t1 * p3[2]),
+        (s2 * p0[0] + t2 * p3[0], s2 * p0[1] + t2 * p3[1], s2 * p0[2] + t2 * p3[2]),
+    )
+
+
+def path_point(state, values, i, absolute):
+    if absolute:
+        return (values[i], values[i + 1])
+    return (state.current[0] + values[i], state.current[1] + values[i + 1])
+
+
+class PathState:
+    __slots__ = ("paths", "sub", "current", "start", "last_cubic", "last_quad")
+
+    def __init__(self):
+        self.paths = []
+        self.sub = None
+        self.current = (0.0, 0.0)
+        self.start = (0.0, 0.0)
+        self.last_cubic = None
+        self.last_quad = None
+
+    def close_subpath(self):
+        if self.sub and (self.sub.points or self.sub.segments):
+            self.paths.append(self.sub)
+        self.sub = None
+
+    def add_line(self, target):
+        sub = self.sub
+        if sub.kind == "POLY":
+            sub.points.append((target[0], -target[1], 0.0))
+        else:
+            p0 = (self.current[0], -self.current[1], 0.0)
+            p3 = (target[0], -target[1], 0.0)
+            sub.segments.append((p0, *line_thirds(p0, p3), p3))
+        self.current = target
+
+    def add_cubic(self, c1, c2, target):
+        # Parser coordinates are floats already, so svg_to_blender() is inlined without the conversions
+        self.sub.segments.append((
+            (self.current[0], -self.current[1], 0.0),
+            (c1[0], -c1[1], 0.0),
+            (c2[0], -c2[1], 0.0),
+            (target[0], -target[1], 0.0),
+        ))
+        self.current = target
+
+    def promote_to_bezier(self):
+        sub = self.sub
+        if sub.kind == "BEZIER":
+            return
+        pts = sub.points
+        sub.kind = "BEZIER"
+        sub.segments = [(a, *line_thirds(a, b), b) for a, b in zip(pts, pts[1:])]
+
+
+def _path_move(state, values, absolute):
+    state.close_subpath()
+    state.current = state.start = path_point(state, values, 0, absolute)
+    state.sub = SvgSubpath("POLY", [svg_to_blender(state.current)], [])
+    _path_line(state, values[2:], absolute)
+
+
+def _path_line(state, values, absolute):
+    for i in range(0, len(values), 2):
+        state.add_line(path_point(state, values, i, absolute))
+    state.last_cubic = state.last_quad = None
+
+
+def _path_horizontal(state, values, absolute):
+    for x in values:
+        state.add_line((x if absolute else state.current[0] + x, state.current[1]))
+    state.last_cubic = state.last_quad = None
+
+
+def _path_vertical(state, values, absolute):
+    for y in values:
+        state.add_line((state.current[0], y if absolute else state.current[1] + y))
+    state.last_cubic = state.last_quad = None
+
+
+def _path_cubic(state, values, absolute):
+    state.promote_to_bezier()
+    for i in range(0, len(values), 6):
+        c1 = path_point(state, values, i, absolute)
+        c2 = path_point(state, values, i + 2, absolute)
+        state.add_cubic(c1, c2, path_point(state, values, i + 4, absolute))
+        state.last_cubic = c2
+    state.last_quad = None
+
+
+def _path_smooth_cubic(state, values, absolute):
+    state.promote_to_bezier()
+    for i in range(0, len(values), 4):
+        c1 = reflect(state.last_cubic, state.current) if state.last_cubic else state.current
+        c2 = path_point(state, values, i, absolute)
+        state.add_cubic(c1, c2, path_point(state, values, i + 2, absolute))
+        state.last_cubic = c2
+    state.last_quad = None
+
+
+def _path_quadratic_to(state, q1, target):
+    current = state.current
+    c1 = (current[0] + (2.0 / 3.0) * (q1[0] - current[0]), current[1] + (2.0 / 3.0) * (q1[1] - current[1]))
+    c2 = (target[0] + (2.0 / 3.0) * (q1[0] - target[0]), target[1] + (2.0 / 3.0) * (q1[1] - target[1]))
+    state.add_cubic(c1, c2, target)
+    state.last_quad = q1
+
+
+def _path_quadratic(state, values, absolute):
+    state.promote_to_bezier()
+    for i in range(0, len(values), 4):
+        _path_quadratic_to(state, path_point(state, values, i, absolute), path_point(state, values, i + 2, absolute))
+    state.last_cubic = None
+
+
+def _path_smooth_quadratic(state, values, absolute):
+    state.promote_to_bezier()
+    for i in range(0, len(values), 2):
+        q1 = reflect(state.last_quad, state.current) if state.last_quad else state.current
+        _path_quadratic_to(state, q1, path_point(state, values, i, absolute))
+    state.last_cubic = None
+
+
+def _path_close(state, values, absolute):
+    if state.sub:
+        state.sub.cyclic = True
+    state.current = state.start
+    state.close_subpath()
+    state.last_cubic = state.last_quad = None
+
+
+# Command letter -> (numbers per repetition, handler)
+PATH_COMMANDS = {
+    "M": (2, _path_move),
+    "L": (2, _path_line),
+    "H": (1, _path_horizontal),
+    "V": (1, _path_vertical),
+    "C": (6, _path_cubic),
+    "S": (4, _path_smooth_cubic),
+    "Q": (4, _path_quadratic),
+    "T": (2, _path_smooth_quadratic),
+    "Z": (0, _path_close),
+}
+
+
+def parse_path_data(d):
+    state = PathState()
+    for command, values in tokenize_path_data(d):
+        if command is None:
+            break
+        c = command.upper()
+        if c == "A":
+            raise ValueError("SVG arc commands are not supported; convert arcs to paths first")
+        arity, handler = PATH_COMMANDS[c]
+        if arity == 0:
+            handler(state, values, True)
+            # Numbers after a close command have no command to apply to, parsing stops there
+            if values:
+                break
+            continue
+        if len(values) % arity or (c == "M" and not values):
+            raise ValueError(f"Incomplete SVG path data for command '{command}'")
+        if state.sub is None and c != "M":
+            state.sub = SvgSubpath("POLY", [svg_to_blender(state.current)], [])
+        handler(state, values, command.isupper())
+    state.close_subpath()
+    return state.paths
+
+
+def parse_points_attribute(text):
+    nums = [float(v) for v in PATH_NUMBER_RE.findall(text or "")]
+    return [svg_to_blender((nums[i], nums[i + 1])) for i in range(0, len(nums) - 1, 2)]
+
+
+def svg_local_name(element):
+    return element.tag.rsplit("}", 1)[-1]
+
+
+def iter_svg_subpaths(source):
+    # Shape elements are handled as their end tags arrive and then dropped from the tree, so memory
+    # depends on the largest element rather than the size of the document
+    open_elements = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            open_elements.append(elem)
+            continue
+        open_elements.pop()
+        name = svg_local_name(elem)
+        if name == "path" and elem.get("d"):
+            yield from parse_path_data(elem.get("d"))
+        elif name in {"polyline", "polygon"}:
+            yield SvgSubpath("POLY", parse_points_attribute(elem.get("points", "")), [], name == "polygon")
+        elif name == "line":
+            pts = [svg_to_blender((elem.get("x1", 0), elem.get("y1", 0))), svg_to_blender((elem.get("x2", 0), elem.get("y2", 0)))]
+            yield SvgSubpath("POLY", pts, [], False)
+        elem.clear()
+        if open_elements:
+            parent = open_elements[-1]
+            if len(parent) and parent[-1] is elem:
+                del parent[-1]
+            else:
+                parent.remove(elem)
+
+
+def parse_svg_file(filepath):
+    # Worker entry point. Returns plain (kind, points, segments, cyclic) rows rather than SvgSubpath instances so
+    # the result unpickles without this module being importable by its top-level name in the caller.
+    return [(sub.kind, sub.points, sub.segments, sub.cyclic) for sub in iter_svg_subpaths(filepath)]
+
+
+def svg_subpaths_from_rows(rows):
+    return [SvgSubpath(kind, points, segments, cyclic) for kind, points, segments, cyclic in rows]
+
+
+class BoundsAccumulator:
+    def __init__(self):
+        self.min_x = self.min_y = math.inf
+        self.max_x = self.max_y = -math.inf
+
+    @property
+    def empty(self):
+        return self.min_x > self.max_x
+
+    def add_extent(self, min_x, min_y, max_x, max_y):
+        self.min_x = min(self.min_x, min_x)
+        self.min_y = min(self.min_y, min_y)
+        self.max_x = max(self.max_x, max_x)
+        self.max_y = max(self.max_y, max_y)
+
+    def add_points(self, points):
+        for x, y in points:
+            self.add_extent(x, y, x, y)
+
+
+def path_decimals(coordinate_scale, resolution=PATH_RESOLUTION):
+    step = abs(coordinate_scale) * resolution
+    if step <= 0.0:
+        return 6
+    return max(0, min(6, math.ceil(-math.log10(step) - EPS)))
+
+
+def format_path_number(n, decimals):
+    # n is a coordinate in grid steps of 10**-decimals; drop trailing zeros and the leading "0" of fractions
+    if decimals == 0:
+        return str(n)
+    sign = "-" if n < 0 else ""
+    whole, frac = divmod(abs(n), 10 ** decimals)
+    frac_text = f"{frac:0{decimals}d}".rstrip("0")
+    if not frac_text:
+        return f"{sign}{whole}"
+    return f"{sign}{whole or ''}.{frac_text}"
+
+
+def join_path_numbers(texts, previous=""):
+    # A separator is only needed when the next number could be read as part of the previous one
+    parts = []
+    for text in texts:
+        if previous and text[0] != "-" and not (text[0] == "." and "." in previous):
+            parts.append(" ")
+        parts.append(text)
+        previous = text
+    return "".join(parts), previous
+
+
+def is_straight_cubic(p0, c1, c2, p3):
+    # Integer grid test: both handles within half a step of the chord and not past either end
+    dx = p3[0] - p0[0]
+    dy = p3[1] - p0[1]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return c1 == p0 and c2 == p0
+    for cx, cy in (c1, c2):
+        ux = cx - p0[0]
+        uy = cy - p0[1]
+        cross = dx * uy - dy * ux
+        if 4 * cross * cross > length_sq:
+            return False
+        dot = dx * ux + dy * uy
+        if dot < 0 or dot > length_sq:
+            return False
+    return True
+
+
+class PathEncoder:
+    # Writes one quantized subpath, choosing the shorter of absolute and relative form for every command
+    __slots__ = ("decimals", "factor", "parts", "repeat", "last_number", "current", "start", "last_control")
+
+    def __init__(self, decimals=2):
+        self.decimals = decimals
+        self.factor = 10 ** decimals
+        self.parts = []
+        self.repeat = None
+        self.last_number = ""
+        self.current = (0, 0)
+        self.start = (0, 0)
+        self.last_control = None
+
+    def quantize(self, x, y):
+        return round(x * self.factor), round(y * self.factor)
+
+    def command_text(self, letter, values):
+        texts = [format_path_number(v, self.decimals) for v in values]
+        if letter == self.repeat:
+            text, last = join_path_numbers(texts, self.last_number)
+        else:
+            text, last = join_path_numbers(texts)
+            text = letter + text
+        return text, last
+
+    def emit(self, absolute, relative):
+        best = None
+        for letter, values in (absolute, relative):
+            text, last = self.command_text(letter, values)
+            if best is None or len(text) < len(best[1]):
+                best = (letter, text, last)
+        letter, text, last = best
+        self.parts.append(text)
+        self.last_number = last
+        # Coordinates after a moveto are implicit linetos
+        self.repeat = {"M": "L", "m": "l"}.get(letter, letter)
+
+    def move_to(self, x, y):
+        point = self.quantize(x, y)
+        self.emit(("M", point), ("M", point))
+        self.current = self.start = point
+        self.last_control = None
+
+    def line_to_grid(self, point):
+        cx, cy = self.current
+        dx = point[0] - cx
+        dy = point[1] - cy
+        if dy == 0 and dx != 0:
+            self.emit(("H", (point[0],)), ("h", (dx,)))
+        elif dx == 0 and dy != 0:
+            self.emit(("V", (point[1],)), ("v", (dy,)))
+        else:
+            self.emit(("L", point), ("l", (dx, dy)))
+        self.current = point
+        self.last_control = None
+
+    def line_to(self, x, y):
+        self.line_to_grid(self.quantize(x, y))
+
+    def cubic_to(self, x1, y1, x2, y2, x3, y3):
+        c1 = self.quantize(x1, y1)
+        c2 = self.quantize(x2, y2)
+        point = self.quantize(x3, y3)
+        cx, cy = self.current
+        if is_straight_cubic(self.current, c1, c2, point):
+            self.line_to_grid(point)
+            return
+        rel2 = (c2[0] - cx, c2[1] - cy, point[0] - cx, point[1] - cy)
+        lc = self.last_control
+        if lc is not None and c1 == (2 * cx - lc[0], 2 * cy - lc[1]):
+            self.emit(("S", c2 + point), ("s", rel2))
+        else:
+            self.emit(("C", c1 + c2 + point), ("c", (c1[0] - cx, c1[1] - cy) + rel2))
+        self.current = point
+        self.last_control = c2
+
+    def close(self):
+        self.parts.append("z")
+        self.repeat = None
+        self.last_number = ""
+        self.current = self.start
+        self.last_control = None
+
+    def text(self):
+        return "".join(self.parts)
+
+
+def optimized_path_from_poly(points, cyclic=False, scale=1.0, decimals=2):
+    if not points:
+        return ""
+    encoder = PathEncoder(decimals)
+    encoder.move_to(*svg_xy(points[0], scale))
+    for point in points[1:]:
+        encoder.line_to(*svg_xy(point, scale))
+    if cyclic:
+        encoder.close()
+    return encoder.text()
+
+
+def optimized_path_from_beziers(segments, cyclic=False, scale=1.0, decimals=2):
+    if not segments:
+        return ""
+    encoder = PathEncoder(decimals)
+    encoder.move_to(*svg_xy(segments[0][0], scale))
+    for _p0, p1, p2, p3 in segments:
+        encoder.cubic_to(*svg_xy(p1, scale), *svg_xy(p2, scale), *svg_xy(p3, scale))
+    if cyclic:
+        encoder.close()
+    return encoder.text()
+
+
+def flat_coords(points, w=None):
+    if w is None:
+        return [v for p in points for v in (p[0], p[1], p[2] if len(p) > 2 else 0.0)]
+    return [v for p in points for v in (p[0], p[1], p[2] if len(p) > 2 else 0.0, w)]
+
+
+def svg_number(v):
+    if abs(v) < 1.0e-9:
+        v = 0.0
+    return f"{v:.6g}"
+
+
+def path_from_poly(points, cyclic=False, scale=1.0):
+    if not points:
+        return ""
+    x, y = svg_xy(points[0], scale)
+    parts = [f"M {svg_number(x)} {svg_number(y)}"]
+    for point in points[1:]:
+        x, y = svg_xy(point, scale)
+        parts.append(f"L {svg_number(x)} {svg_number(y)}")
+    if cyclic:
+        parts.append("Z")
+    return " ".join(parts)
+
+
+def path_from_beziers(segments, cyclic=False, scale=1.0):
+    if not segments:
+        return ""
+    x, y = svg_xy(segments[0][0], scale)
+    parts = [f"M {svg_number(x)} {svg_number(y)}"]
+    for p0, p1, p2, p3 in segments:
+        x1, y1 = svg_xy(p1, scale)
+        x2, y2 = svg_xy(p2, scale)
+        x3, y3 = svg_xy(p3, scale)
+        parts.append(f"C {svg_number(x1)} {svg_number(y1)} {svg_number(x2)} {svg_number(y2)} {svg_number(x3)} {svg_number(y3)}")
+    if cyclic:
+        parts.append("Z")
+    return " ".join(parts)
+
+
+def svg_view_box(bounds, view_box_mode="SCENE_ORIGIN"):
+    min_x, min_y, max_x, max_y = bounds.min_x, bounds.min_y, bounds.max_x, bounds.max_y
+    if view_box_mode == "SCENE_ORIGIN":
+        min_x = min(min_x, 0.0)
+        min_y = min(min_y, 0.0)
+        max_x = max(max_x, 0.0)
+        max_y = max(max_y, 0.0)
+    return min_x, min_y, max(max_x - min_x, 1.0), max(max_y - min_y, 1.0)
+
+
+def open_svg_output(filepath, compress=False):
+    if compress or filepath.lower().endswith(".svgz"):
+        return gzip.open(filepath, "wt", encoding="utf-8", newline="\n")
+    return open(filepath, "w", encoding="utf-8", newline="\n")
+
+
+def svg_use_element(group, transform):
+    return f'<use xlink:href="#{group.shape_id}" transform="matrix({" ".join(svg_number(v) for v in transform)})" />'
+
+
+def write_svg(
+    filepath, shapes, bounds, coordinate_scale=100.0, view_box_mode="SCENE_ORIGIN",
+    compress=False, optimize=False, deduplicate=False,
+):
+    # Returns the number of path data bytes saved by optimization
+    coordinate_scale = max(float(coordinate_scale), EPS)
+    saved = 0
+    min_x, min_y, width, height = svg_view_box(bounds, view_box_mode)
+    # Written beside the target and moved into place, so a failed export never leaves a truncated file
+    temp_path = filepath + ".tmp"
+    try:
+        with open_svg_output(temp_path, compress or filepath.lower().endswith(".svgz")) as handle:
+            handle.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            namespaces = 'xmlns="http://www.w3.org/2000/svg"'
+            if deduplicate:
+                namespaces += ' xmlns:xlink="http://www.w3.org/1999/xlink"'
+            handle.write(
+                f'<svg {namespaces} version="1.1" '
+                f'viewBox="{svg_number(min_x)} {svg_number(min_y)} {svg_number(width)} {svg_number(height)}" '
+                f'width="{svg_number(width)}" height="{svg_number(height)}">'
+            )
+            open_group = None
+            for kind, data, cyclic, group in shapes:
+                if kind == "USE":
+                    # A later placement of a shared shape, written at its own place in the paint order
+                    if open_group is not None:
+                        handle.write("</g></defs>" + svg_use_element(open_group, open_group.transforms[0]))
+                        open_group = None
+                    handle.write(svg_use_element(group, data))
+                    continue
+                if group is not open_group:
+                    # Shared shapes arrive as a run of splines, close the previous definition before starting the next
+                    if open_group is not None:
+                        handle.write("</g></defs>" + svg_use_element(open_group, open_group.transforms[0]))
+                    if group is not None:
+                        handle.write(f'<defs><g id="{group.shape_id}">')
+                    open_group = group
+                if kind == "POLY":
+                    d = path_from_poly(data, cyclic, coordinate_scale)
+                else:
+                    d = path_from_beziers(data, cyclic, coordinate_scale)
+                if optimize and d:
+                    # Quantize shared shapes finely enough for their largest placement
+                    decimals = path_decimals(coordinate_scale * (group.scale if group is not None else 1.0))
+                    plain_size = len(d)
+                    if kind == "POLY":
+                        d = optimized_path_from_poly(data, cyclic, coordinate_scale, decimals)
+                    else:
+                        d = optimized_path_from_beziers(data, cyclic, coordinate_scale, decimals)
+                    saved += plain_size - len(d)
+                if not d:
+                    continue
+                if group is None:
+                    handle.write(f'<path d="{d}" fill="none" stroke="black" stroke-width="1" />')
+                else:
+                    handle.write(f'<path d="{d}" fill="none" stroke="black" stroke-width="1" vector-effect="non-scaling-stroke" />')
+            if open_group is not None:
+                handle.write("</g></defs>" + svg_use_element(open_group, open_group.transforms[0]))
+            handle.write("</svg>")
+        os.replace(temp_path, filepath)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return saved
+
+
+def frame_filepath(filepath, frame):
+    root, extension = os.path.splitext(filepath)
+    return f"{root}_{frame:04d}{extension}"
+
+
+def reuse_svg_file(source, target):
+    if os.path.exists(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+    return 0
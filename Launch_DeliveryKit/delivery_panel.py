@@ -603,6 +603,105 @@ class DELIVERYKIT_OT_output(bpy.types.Operator):
 		# Done
 		return {'FINISHED'}
 
+###########################################################################
+# Cached draw summary
+
+# The panel redraws constantly and counting exportable objects walks the whole selection or collection
+# hierarchy, so the result is cached per selection state and cleared by the depsgraph and file load handlers
+# whenever the scene actually changes (selection, membership, renames and object types all tag the depsgraph)
+_summary_cache = {}
+
+def delivery_summary(settings):
+	active = bpy.context.active_object
+	key = (
+		bpy.context.scene.name,
+		settings.file_type,
+		settings.file_grouping,
+		active.name if active else '',
+		bool(bpy.context.object and bpy.context.object.select_get()),
+		bpy.context.collection.name if bpy.context.collection else '',
+	)
+	summary = _summary_cache.get(key)
+	if summary is None:
+		_summary_cache.clear()
+		summary = _summary_cache[key] = compute_delivery_summary(settings)
+	return summary
+
+def compute_delivery_summary(settings):
+	file_format = "." + settings.file_type.lower().split("-")[0] # Get only the characters before a dash to support multiple variations of a single format
+	button_enable = True
+	button_icon = "FILE"
+	button_title = ''
+	object_count = 0
+	
+	# Check if at least one object is selected
+	if bpy.context.object and bpy.context.object.select_get():
+		# CSV Positions can use any object; CSV Points use evaluated mesh-compatible objects
+		if settings.file_type == "CSV-2":
+			object_count = len(bpy.context.selected_objects)
+		elif settings.file_type == "CSV-1":
+			object_count = len([obj for obj in bpy.context.selected_objects if obj.type in delivery_object_types])
+		
+		# Geometry: count only supported meshes and curves that are not hidden
+		else:
+			object_count = len([obj for obj in bpy.context.selected_objects if obj.type in delivery_object_types])
+		
+		
+		
+		# Button title
+		if object_count > 1 and settings.file_grouping == "COMBINED":
+			button_title = bpy.context.active_object.name + file_format
+		elif object_count == 1:
+			if bpy.context.active_object.type not in delivery_object_types and settings.file_grouping == "INDIVIDUAL":
+				for obj in bpy.context.selected_objects:
+					if obj.type in delivery_object_types:
+						button_title = obj.name + file_format
+			else:
+				button_title = bpy.context.active_object.name + file_format
+		else:
+			button_title = str(object_count) + " files"
+		
+		# Button icon
+		button_icon = "OUTLINER_OB_MESH"
+	
+	# Active collection fallback
+	else:
+		# CSV Positions can use any object; CSV Points use evaluated mesh-compatible objects
+		if settings.file_type == "CSV-2":
+			object_count = len(bpy.context.collection.all_objects)
+		elif settings.file_type == "CSV-1":
+			object_count = len([obj for obj in bpy.context.collection.all_objects if obj.type in delivery_object_types])
+		# Geometry: count only supported data types (mesh, curve, etcetera) for everything else
+		else:
+			object_count = len([obj for obj in bpy.context.collection.all_objects if obj.type in delivery_object_types])
+		
+		# Button title
+		if settings.file_grouping == "COMBINED":
+			button_title = bpy.context.collection.name + file_format
+		else:
+			button_title = str(object_count) + " files"
+		
+		# Button icon
+		button_icon = "OUTLINER_COLLECTION"
+	
+	# If no usable items are found, disable the button
+	# Keeping the message generic allows this to be used universally
+	if object_count == 0:
+		button_enable = False
+		button_icon = "X"
+		if settings.file_type == "CSV-2":
+			button_title = "Select item"
+		else:
+			button_title = "Select mesh"
+	
+	return object_count, button_title, button_icon, button_enable
+
+@bpy.app.handlers.persistent
+def clear_delivery_summary(*args):
+	_summary_cache.clear()
+
+
+
 ###########################################################################
 # UI rendering class
 
@@ -630,75 +729,13 @@ class DELIVERYKIT_PT_delivery(bpy.types.Panel):
 			settings = context.scene.delivery_kit_settings
 			
 			# Set up variables
-			file_format = "." + settings.file_type.lower().split("-")[0] # Get only the characters before a dash to support multiple variations of a single format
-			button_enable = True
-			button_icon = "FILE"
-			button_title = ''
 			info_box = ''
 			show_anim = False
 			show_group = True
 			show_csv = False
-			object_count = 0
-			
-			# Check if at least one object is selected
-			if bpy.context.object and bpy.context.object.select_get():
-				# CSV Positions can use any object; CSV Points use evaluated mesh-compatible objects
-				if settings.file_type == "CSV-2":
-					object_count = len(bpy.context.selected_objects)
-				elif settings.file_type == "CSV-1":
-					object_count = len([obj for obj in bpy.context.selected_objects if obj.type in delivery_object_types])
-				
-				# Geometry: count only supported meshes and curves that are not hidden
-				else:
-					object_count = len([obj for obj in bpy.context.selected_objects if obj.type in delivery_object_types])
-				
-				
-				
-				# Button title
-				if object_count > 1 and settings.file_grouping == "COMBINED":
-					button_title = bpy.context.active_object.name + file_format
-				elif object_count == 1:
-					if bpy.context.active_object.type not in delivery_object_types and settings.file_grouping == "INDIVIDUAL":
-						for obj in bpy.context.selected_objects:
-							if obj.type in delivery_object_types:
-								button_title = obj.name + file_format
-					else:
-						button_title = bpy.context.active_object.name + file_format
-				else:
-					button_title = str(object_count) + " files"
-				
-				# Button icon
-				button_icon = "OUTLINER_OB_MESH"
 			
-			# Active collection fallback
-			else:
-				# CSV Positions can use any object; CSV Points use evaluated mesh-compatible objects
-				if settings.file_type == "CSV-2":
-					object_count = len(bpy.context.collection.all_objects)
-				elif settings.file_type == "CSV-1":
-					object_count = len([obj for obj in bpy.context.collection.all_objects if obj.type in delivery_object_types])
-				# Geometry: count only supported data types (mesh, curve, etcetera) for everything else
-				else:
-					object_count = len([obj for obj in bpy.context.collection.all_objects if obj.type in delivery_object_types])
-				
-				# Button title
-				if settings.file_grouping == "COMBINED":
-					button_title = bpy.context.collection.name + file_format
-				else:
-					button_title = str(object_count) + " files"
-				
-				# Button icon
-				button_icon = "OUTLINER_COLLECTION"
-			
-			# If no usable items are found, disable the button
-			# Keeping the message generic allows this to be used universally
-			if object_count == 0:
-				button_enable = False
-				button_icon = "X"
-				if settings.file_type == "CSV-2":
-					button_title = "Select item"
-				else:
-					button_title = "Select mesh"
+			# Object count, button title and icon, cached until the scene changes
+			object_count, button_title, button_icon, button_enable = delivery_summary(settings)
 			
 			# Specific display cases
 			if settings.file_type in ("USDA", "USDZ"):
@@ -759,6 +796,10 @@ def register():
 	for cls in classes:
 		bpy.utils.register_class(cls)
 	
+	# Drop the cached panel summary whenever the scene changes
+	bpy.app.handlers.depsgraph_update_post.append(clear_delivery_summary)
+	bpy.app.handlers.load_post.append(clear_delivery_summary)
+	
 	# Add keymaps for quick export
 	wm = bpy.context.window_manager
 	kc = wm.keyconfigs.addon
@@ -781,6 +822,12 @@ def unregister():
 		km.keymap_items.remove(kmi)
 	keymaps.clear()
 	
+	# Remove scene change handlers
+	for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.load_post):
+		if clear_delivery_summary in handlers:
+			handlers.remove(clear_delivery_summary)
+	_summary_cache.clear()
+	
 	# Deregister classes
 	for cls in reversed(classes):
 		bpy.utils.unregister_class(cls)
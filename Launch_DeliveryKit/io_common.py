@@ -1,5 +1,9 @@
 import bpy
+import importlib
+import multiprocessing
 import os
+import site
+from concurrent.futures import ProcessPoolExecutor
 
 
 EXPORT_BATCH_MODES = (
@@ -38,3 +42,51 @@ def object_export_path(filepath, obj, extension):
             base_dir = os.path.dirname(base_dir)
     safe_name = bpy.path.clean_name(obj.name) or "Object"
     return f"{base_dir.rstrip('/')}/{safe_name}{extension}"
+
+
+ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class _WorkerModule:
+    # Unpickles as an import of the named top-level module in the worker
+    def __init__(self, name):
+        self.name = name
+
+    def __reduce__(self):
+        return importlib.import_module, (self.name,)
+
+
+class _WorkerFunction:
+    # Pickles as module name plus function name, so the caller never imports the bpy-free modules by their
+    # top-level name. Only workers put the add-on folder on sys.path, and their results are plain data the
+    # caller wraps in its own classes.
+    def __init__(self, module_name, function_name):
+        self.module_name = module_name
+        self.function_name = function_name
+
+    def __call__(self, *args, **kwargs):
+        # Called directly, the function comes from the add-on's own copy of the module
+        if __package__:
+            module = importlib.import_module(f".{self.module_name}", __package__)
+        else:
+            module = importlib.import_module(self.module_name)
+        return getattr(module, self.function_name)(*args, **kwargs)
+
+    def __reduce__(self):
+        return getattr, (_WorkerModule(self.module_name), self.function_name)
+
+
+def process_pool(max_workers=None):
+    # Spawn keeps workers from inheriting Blender's interpreter state, site.addsitedir gives them the add-on
+    # folder on sys.path without adding it to Blender's own
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=site.addsitedir,
+        initargs=(ADDON_DIR,),
+    )
+
+
+def worker_function(module_name, function_name):
+    # Functions submitted to process_pool() are named by their bpy-free module and resolved in the worker
+    return _WorkerFunction(module_name, function_name)
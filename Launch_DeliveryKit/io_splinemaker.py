@@ -1,27 +1,66 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field
+import os
+from array import array
 from pathlib import Path
-from typing import Sequence
+from typing import Iterable, Sequence
 
 import bpy
-from bpy.props import BoolProperty, CollectionProperty, EnumProperty, StringProperty
+from bpy.props import BoolProperty, CollectionProperty, EnumProperty, IntProperty, StringProperty
 from bpy.types import Operator
 from bpy_extras.io_utils import ExportHelper, ImportHelper
 
 try:
-    from .io_common import EXPORT_BATCH_MODES, export_objects, object_export_path
+    import numpy as np
 except ImportError:
-    from io_common import EXPORT_BATCH_MODES, export_objects, object_export_path
+    np = None
 
-DEFAULT_OBJECT_NAME = "SplineMakerCurves"
-DEFAULT_PROJECT_VERSION = 1
-DEFAULT_CURVE_SMOOTHNESS = 0.5
-DEFAULT_ACTION_AREA_SIZE = 0.1
-DEFAULT_RESOLUTION_U = 8
-DEFAULT_ORDER_U = 4
-MIN_POINT_COUNT = 2
+try:
+    from .io_common import EXPORT_BATCH_MODES, export_objects, object_export_path, process_pool, worker_function
+    from .splinemaker_project import (
+        DEFAULT_ACTION_AREA_SIZE,
+        DEFAULT_CURVE_SMOOTHNESS,
+        DEFAULT_OBJECT_NAME,
+        DEFAULT_PROJECT_VERSION,
+        MIN_POINT_COUNT,
+        STREAM_THRESHOLD_BYTES,
+        SplineMakerProject,
+        SplineMakerSpline,
+        _coerce_float,
+        _coerce_int,
+        blender_to_spline_arrays,
+        changed_live_links,
+        clamp_order,
+        load_project,
+        open_project,
+        project_from_data,
+        save_project,
+        spline_point_count,
+        spline_to_blender_arrays,
+    )
+except ImportError:
+    from io_common import EXPORT_BATCH_MODES, export_objects, object_export_path, process_pool, worker_function
+    from splinemaker_project import (
+        DEFAULT_ACTION_AREA_SIZE,
+        DEFAULT_CURVE_SMOOTHNESS,
+        DEFAULT_OBJECT_NAME,
+        DEFAULT_PROJECT_VERSION,
+        MIN_POINT_COUNT,
+        STREAM_THRESHOLD_BYTES,
+        SplineMakerProject,
+        SplineMakerSpline,
+        _coerce_float,
+        _coerce_int,
+        blender_to_spline_arrays,
+        changed_live_links,
+        clamp_order,
+        load_project,
+        open_project,
+        project_from_data,
+        save_project,
+        spline_point_count,
+        spline_to_blender_arrays,
+    )
 
 PROP_MARKER = "spline_maker_project"
 PROP_PROJECT_NAME = "spline_maker_project_name"
@@ -30,204 +69,8 @@ PROP_VERSION = "spline_maker_version"
 PROP_CURVE_SMOOTHNESS = "spline_maker_curve_smoothness"
 PROP_ACTION_LEFT = "spline_maker_action_area_left"
 PROP_ACTION_RIGHT = "spline_maker_action_area_right"
-
-
-def spline_to_blender_coords(x: float, y: float, z: float) -> tuple[float, float, float]:
-    return float(x), -float(z), float(y)
-
-
-def blender_to_spline_coords(x: float, y: float, z: float) -> tuple[float, float, float]:
-    return float(x), float(z), -float(y)
-
-
-@dataclass
-class SplineMakerPoint:
-    x: float
-    y: float
-    z: float
-    size: float = DEFAULT_ACTION_AREA_SIZE
-    weight: float = 1.0
-
-
-@dataclass
-class SplineMakerSpline:
-    points: list[SplineMakerPoint] = field(default_factory=list)
-    cyclic: bool = False
-    order_u: int = DEFAULT_ORDER_U
-    resolution_u: int = DEFAULT_RESOLUTION_U
-
-
-@dataclass
-class SplineMakerProject:
-    project_name: str = ""
-    source_path: str = ""
-    version: int = DEFAULT_PROJECT_VERSION
-    curve_smoothness: float = DEFAULT_CURVE_SMOOTHNESS
-    action_area_left: float = DEFAULT_ACTION_AREA_SIZE
-    action_area_right: float = DEFAULT_ACTION_AREA_SIZE
-    splines: list[SplineMakerSpline] = field(default_factory=list)
-
-
-def clamp_order(order_u: int, point_count: int) -> int:
-    if point_count <= 0:
-        return MIN_POINT_COUNT
-    return max(MIN_POINT_COUNT, min(int(order_u), int(point_count)))
-
-
-def _coerce_float(value, default: float) -> float:
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return float(default)
-
-
-def _coerce_int(value, default: int) -> int:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return int(default)
-
-
-def _coerce_bool(value, default: bool = False) -> bool:
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in {"true", "1", "yes", "on"}:
-            return True
-        if lowered in {"false", "0", "no", "off"}:
-            return False
-    if isinstance(value, (int, float)):
-        return bool(value)
-    return default
-
-
-def load_project(filepath: str) -> tuple[SplineMakerProject, list[str]]:
-    path = Path(filepath)
-    try:
-        raw_data = json.loads(path.read_text(encoding="utf-8"))
-    except FileNotFoundError as exc:
-        raise ValueError(f"JSON file not found: {filepath}") from exc
-    except OSError as exc:
-        raise ValueError(f"Could not read JSON file: {filepath}") from exc
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"JSON parse error in {filepath}: {exc}") from exc
-    
-    if not isinstance(raw_data, dict):
-        raise ValueError("SplineMaker JSON root must be an object")
-    
-    warnings: list[str] = []
-    project = SplineMakerProject(
-        project_name=path.stem,
-        source_path=str(path),
-        version=max(1, _coerce_int(raw_data.get("version"), DEFAULT_PROJECT_VERSION)),
-        curve_smoothness=_coerce_float(
-            raw_data.get("curve_smoothness"),
-            DEFAULT_CURVE_SMOOTHNESS,
-        ),
-    )
-    
-    action_area_sizes = raw_data.get("action_area_sizes", {})
-    if isinstance(action_area_sizes, dict):
-        project.action_area_left = max(
-            0.001,
-            _coerce_float(action_area_sizes.get("left"), DEFAULT_ACTION_AREA_SIZE),
-        )
-        project.action_area_right = max(
-            0.001,
-            _coerce_float(action_area_sizes.get("right"), DEFAULT_ACTION_AREA_SIZE),
-        )
-    else:
-        warnings.append("action_area_sizes is not an object; default sizes were used")
-        project.action_area_left = DEFAULT_ACTION_AREA_SIZE
-        project.action_area_right = DEFAULT_ACTION_AREA_SIZE
-    
-    splines_data = raw_data.get("splines", [])
-    if not isinstance(splines_data, list):
-        raise ValueError("SplineMaker JSON field 'splines' must be an array")
-    
-    for spline_index, spline_data in enumerate(splines_data):
-        if not isinstance(spline_data, dict):
-            warnings.append(f"Spline {spline_index} is not an object and was skipped")
-            continue
-        
-        points_data = spline_data.get("points", [])
-        if not isinstance(points_data, list):
-            warnings.append(f"Spline {spline_index} points are not an array and were skipped")
-            continue
-        
-        points: list[SplineMakerPoint] = []
-        for point_index, point_data in enumerate(points_data):
-            if not isinstance(point_data, dict):
-                warnings.append(
-                    f"Spline {spline_index} point {point_index} is not an object and was skipped"
-                )
-                continue
-            
-            points.append(
-                SplineMakerPoint(
-                    x=_coerce_float(point_data.get("x"), 0.0),
-                    y=_coerce_float(point_data.get("y"), 0.0),
-                    z=_coerce_float(point_data.get("z"), 0.0),
-                    size=max(0.001, _coerce_float(point_data.get("size"), DEFAULT_ACTION_AREA_SIZE)),
-                    weight=max(0.001, _coerce_float(point_data.get("weight"), 1.0)),
-                )
-            )
-        
-        if len(points) < MIN_POINT_COUNT:
-            warnings.append(
-                f"Spline {spline_index} has fewer than {MIN_POINT_COUNT} valid points and was skipped"
-            )
-            continue
-        
-        project.splines.append(
-            SplineMakerSpline(
-                points=points,
-                cyclic=_coerce_bool(spline_data.get("cyclic"), False),
-                order_u=clamp_order(
-                    _coerce_int(spline_data.get("order_u"), DEFAULT_ORDER_U),
-                    len(points),
-                ),
-                resolution_u=max(
-                    1,
-                    _coerce_int(spline_data.get("resolution_u"), DEFAULT_RESOLUTION_U),
-                ),
-            )
-        )
-    
-    return project, warnings
-
-
-def save_project(filepath: str, project: SplineMakerProject) -> None:
-    path = Path(filepath)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "version": max(1, int(project.version)),
-        "curve_smoothness": float(project.curve_smoothness),
-        "splines": [
-            {
-                "cyclic": bool(spline.cyclic),
-                "order_u": clamp_order(spline.order_u, len(spline.points)),
-                "points": [
-                    {
-                        "x": float(point.x),
-                        "y": float(point.y),
-                        "z": float(point.z),
-                        "size": max(0.001, float(point.size)),
-                        "weight": max(0.001, float(point.weight)),
-                    }
-                    for point in spline.points
-                ],
-            }
-            for spline in project.splines
-            if len(spline.points) >= MIN_POINT_COUNT
-        ],
-        "action_area_sizes": {
-            "left": max(0.001, float(project.action_area_left)),
-            "right": max(0.001, float(project.action_area_right)),
-        },
-    }
-    path.write_text(json.dumps(payload, indent=4), encoding="utf-8")
+PROP_SOURCE_MTIME = "spline_maker_source_mtime"
+LIVE_LINK_INTERVAL = 0.5
 
 
 def _ensure_single_user_curve_data(curve_object: bpy.types.Object) -> bpy.types.Curve:
@@ -238,8 +81,8 @@ def _ensure_single_user_curve_data(curve_object: bpy.types.Object) -> bpy.types.
     return curve_data
 
 
-def clear_curve_splines(curve_data: bpy.types.Curve) -> None:
-    while curve_data.splines:
+def clear_curve_splines(curve_data: bpy.types.Curve, start: int = 0) -> None:
+    while len(curve_data.splines) > start:
         last_index = len(curve_data.splines) - 1
         curve_data.splines.remove(curve_data.splines[last_index])
 
@@ -292,18 +135,67 @@ def store_project_metadata(curve_object: bpy.types.Object, project: SplineMakerP
         "SplineMaker right controller action area size",
     )
     
+    try:
+        source_mtime = os.path.getmtime(project.source_path) if project.source_path else 0.0
+    except OSError:
+        source_mtime = 0.0
+    _set_idprop_value(
+        curve_object,
+        PROP_SOURCE_MTIME,
+        source_mtime,
+        "Modification time of the SplineMaker JSON when it was last synced",
+    )
+    
     curve_data[PROP_MARKER] = True
     curve_data[PROP_PROJECT_NAME] = project.project_name or curve_object.name
     curve_data[PROP_VERSION] = max(1, int(project.version))
 
 
+def _write_nurbs_spline(blender_spline, spline_spec: SplineMakerSpline, point_count: int, arrays=None) -> None:
+    co, radii = arrays or spline_to_blender_arrays(spline_spec)
+    blender_spline.points.foreach_set("co", co)
+    blender_spline.points.foreach_set("radius", radii)
+    blender_spline.points.foreach_set("tilt", [0.0] * point_count)
+    
+    blender_spline.order_u = clamp_order(spline_spec.order_u, point_count)
+    blender_spline.resolution_u = max(1, int(spline_spec.resolution_u))
+    blender_spline.use_cyclic_u = bool(spline_spec.cyclic)
+    blender_spline.use_endpoint_u = not blender_spline.use_cyclic_u
+
+
+def _nurbs_spline_matches(blender_spline, spline_spec: SplineMakerSpline, point_count: int, arrays) -> bool:
+    # Compares against what _write_nurbs_spline would write, read back with foreach_get at float precision
+    if (
+        blender_spline.order_u != clamp_order(spline_spec.order_u, point_count)
+        or blender_spline.resolution_u != max(1, int(spline_spec.resolution_u))
+        or blender_spline.use_cyclic_u != bool(spline_spec.cyclic)
+        or blender_spline.use_endpoint_u == bool(spline_spec.cyclic)
+    ):
+        return False
+    co, radii = arrays
+    for name, values in (("co", co), ("radius", radii), ("tilt", [0.0] * point_count)):
+        if np is not None:
+            current = np.empty(len(values), dtype=np.float32)
+            blender_spline.points.foreach_get(name, current)
+            if not np.array_equal(current, np.asarray(values, dtype=np.float32)):
+                return False
+        else:
+            current = [0.0] * len(values)
+            blender_spline.points.foreach_get(name, current)
+            if array("f", current) != array("f", values):
+                return False
+    return True
+
+
 def build_curve_object_from_project(
     context: bpy.types.Context,
     project: SplineMakerProject,
     *,
     object_name: str = DEFAULT_OBJECT_NAME,
     target_object: bpy.types.Object | None = None,
+    splines: Iterable[SplineMakerSpline] | None = None,
 ) -> tuple[bpy.types.Object, list[str]]:
+    # splines overrides project.splines, so a streamed project can be built while it is still being parsed
     warnings: list[str] = []
     
     if target_object is None:
@@ -320,40 +212,126 @@ def build_curve_object_from_project(
     curve_data.dimensions = "3D"
     clear_curve_splines(curve_data)
     
-    for spline_index, spline_spec in enumerate(project.splines):
-        point_count = len(spline_spec.points)
+    try:
+        for spline_index, spline_spec in enumerate(project.splines if splines is None else splines):
+            point_count = spline_point_count(spline_spec)
+            if point_count < MIN_POINT_COUNT:
+                warnings.append(
+                    f"Spline {spline_index} has fewer than {MIN_POINT_COUNT} points and was skipped"
+                )
+                continue
+            
+            blender_spline = curve_data.splines.new("NURBS")
+            blender_spline.points.add(point_count - 1)
+            _write_nurbs_spline(blender_spline, spline_spec, point_count)
+    except Exception:
+        if target_object is None:
+            bpy.data.objects.remove(curve_object)
+            bpy.data.curves.remove(curve_data)
+        raise
+    
+    if project.project_name and target_object is None:
+        curve_object.name = project.project_name
+
+    store_project_metadata(curve_object, project)
+    
+    return curve_object, warnings
+
+
+def update_curve_from_project(
+    curve_object: bpy.types.Object,
+    project: SplineMakerProject,
+    *,
+    splines: Iterable[SplineMakerSpline] | None = None,
+) -> list[str]:
+    # Reuses the object's existing splines in order. A NURBS spline whose point count is unchanged is compared
+    # with the incoming data and left alone when it matches, so an edit touching a few splines only writes
+    # those. A spline that gained points grows in place with points.add. Points can't be removed from a
+    # Blender spline and splines can't be reordered, so a spline that lost points is replaced together with
+    # every spline after it to keep the file order; that edit costs a rebuild of the tail.
+    warnings: list[str] = []
+    curve_data = _ensure_single_user_curve_data(curve_object)
+    curve_data.dimensions = "3D"
+    reused = 0
+    rebuilding = False
+    changed = False
+    
+    for spline_index, spline_spec in enumerate(project.splines if splines is None else splines):
+        point_count = spline_point_count(spline_spec)
         if point_count < MIN_POINT_COUNT:
             warnings.append(
                 f"Spline {spline_index} has fewer than {MIN_POINT_COUNT} points and was skipped"
             )
             continue
         
+        if not rebuilding and reused < len(curve_data.splines):
+            blender_spline = curve_data.splines[reused]
+            current_count = len(blender_spline.points)
+            if blender_spline.type == "NURBS" and current_count <= point_count:
+                arrays = spline_to_blender_arrays(spline_spec)
+                if current_count < point_count:
+                    blender_spline.points.add(point_count - current_count)
+                    _write_nurbs_spline(blender_spline, spline_spec, point_count, arrays)
+                    changed = True
+                elif not _nurbs_spline_matches(blender_spline, spline_spec, point_count, arrays):
+                    _write_nurbs_spline(blender_spline, spline_spec, point_count, arrays)
+                    changed = True
+                reused += 1
+                continue
+            clear_curve_splines(curve_data, reused)
+            rebuilding = True
+        
         blender_spline = curve_data.splines.new("NURBS")
         blender_spline.points.add(point_count - 1)
-        
-        for point_index, point in enumerate(spline_spec.points):
-            blender_point = blender_spline.points[point_index]
-            blender_x, blender_y, blender_z = spline_to_blender_coords(point.x, point.y, point.z)
-            blender_point.co = (
-                blender_x,
-                blender_y,
-                blender_z,
-                max(0.001, float(point.weight)),
-            )
-            blender_point.radius = max(0.001, float(point.size))
-            blender_point.tilt = 0.0
-        
-        blender_spline.order_u = clamp_order(spline_spec.order_u, point_count)
-        blender_spline.resolution_u = max(1, int(spline_spec.resolution_u))
-        blender_spline.use_cyclic_u = bool(spline_spec.cyclic)
-        blender_spline.use_endpoint_u = not blender_spline.use_cyclic_u
+        _write_nurbs_spline(blender_spline, spline_spec, point_count)
+        reused += 1
+        changed = True
     
-    if project.project_name and target_object is None:
-        curve_object.name = project.project_name
-
+    if not rebuilding and reused < len(curve_data.splines):
+        clear_curve_splines(curve_data, reused)
+        changed = True
+    if changed:
+        curve_data.update_tag()
     store_project_metadata(curve_object, project)
     
-    return curve_object, warnings
+    return warnings
+
+
+def sync_live_links() -> list[bpy.types.Object]:
+    # Objects are matched to files through their stored source path. A path claimed by several objects (a
+    # combined export) is ambiguous and left alone.
+    claims: dict[str, list[bpy.types.Object]] = {}
+    for obj in bpy.data.objects:
+        if obj.type != "CURVE" or obj.library is not None or not obj.get(PROP_MARKER):
+            continue
+        source_path = str(obj.get(PROP_SOURCE_PATH, ""))
+        if source_path:
+            claims.setdefault(os.path.normpath(bpy.path.abspath(source_path)), []).append(obj)
+    
+    updated = []
+    for filepath, curve_object, mtime in changed_live_links(claims, lambda obj: obj.get(PROP_SOURCE_MTIME)):
+        # The whole file is parsed before the curve is touched, so a bad file leaves it as it was
+        try:
+            project, warnings = load_project(filepath)
+            warnings += update_curve_from_project(curve_object, project)
+            updated.append(curve_object)
+        except Exception as exc:
+            warnings = [str(exc)]
+        for message in warnings:
+            print(f"SplineMaker live link | {Path(filepath).name}: {message}")
+        # The mtime read before parsing is kept even when parsing failed, a half-written file is retried on its
+        # next save rather than on every tick
+        curve_object[PROP_SOURCE_MTIME] = mtime
+    
+    return updated
+
+
+def _live_link_tick():
+    try:
+        sync_live_links()
+    except Exception as exc:
+        print(f"SplineMaker live link failed: {exc}")
+    return LIVE_LINK_INTERVAL
 
 
 def read_project_metadata(
@@ -447,29 +425,21 @@ def project_from_curve_objects(
                 )
                 continue
             
-            points: list[SplineMakerPoint] = []
-            for point in spline.points:
-                blender_x, blender_y, blender_z, w = point.co
-                spline_x, spline_y, spline_z = blender_to_spline_coords(
-                    blender_x,
-                    blender_y,
-                    blender_z,
-                )
-                points.append(
-                    SplineMakerPoint(
-                        x=spline_x,
-                        y=spline_y,
-                        z=spline_z,
-                        size=max(0.001, float(point.radius)),
-                        weight=max(0.001, float(w)),
-                    )
-                )
+            count = len(spline.points)
+            if np is not None:
+                co = np.empty(count * 4, dtype=np.float32)
+                radii = np.empty(count, dtype=np.float32)
+            else:
+                co = [0.0] * (count * 4)
+                radii = [0.0] * count
+            spline.points.foreach_get("co", co)
+            spline.points.foreach_get("radius", radii)
             
             project.splines.append(
                 SplineMakerSpline(
-                    points=points,
+                    columns=blender_to_spline_arrays(co, radii),
                     cyclic=bool(spline.use_cyclic_u),
-                    order_u=clamp_order(int(spline.order_u), len(points)),
+                    order_u=clamp_order(int(spline.order_u), count),
                     resolution_u=max(1, int(spline.resolution_u)),
                 )
             )
@@ -493,6 +463,15 @@ def suggest_project_name(
     return "SplineMakerProject"
 
 
+def _streams_on_main_thread(filepath: str) -> bool:
+    # Files past the streaming threshold are parsed here so their splines reach the builder as they are read,
+    # a worker would have to load and pickle the whole project
+    try:
+        return Path(filepath).stat().st_size >= STREAM_THRESHOLD_BYTES
+    except OSError:
+        return False
+
+
 def _report_messages(operator: Operator, level: set[str], messages: list[str]) -> None:
     for message in messages:
         operator.report(level, message)
@@ -528,23 +507,41 @@ class IMPORT_SCENE_OT_spline_maker_json(Operator, ImportHelper):
         imported_objects = []
         all_warnings: list[str] = []
         
-        for filepath in filepaths:
-            try:
-                project, warnings = load_project(filepath)
-                object_name = Path(filepath).stem or DEFAULT_OBJECT_NAME
-                curve_object, build_warnings = build_curve_object_from_project(
-                    context,
-                    project,
-                    object_name=object_name,
-                    target_object=None,
-                )
-                imported_objects.append(curve_object)
-                all_warnings.extend([f"{Path(filepath).name}: {msg}" for msg in warnings + build_warnings])
-            except ValueError as exc:
-                all_warnings.append(f"{Path(filepath).name}: {exc}")
-            except Exception as exc:
-                self.report({"ERROR"}, f"SplineMaker import failed: {exc}")
-                return {"CANCELLED"}
+        # Projects load concurrently in worker processes, curve objects are built here in file order
+        executor = process_pool() if len(filepaths) > 1 else None
+        try:
+            load = worker_function("splinemaker_project", "load_project_data") if executor is not None else None
+            futures = [
+                executor.submit(load, filepath)
+                if executor is not None and not _streams_on_main_thread(filepath)
+                else None
+                for filepath in filepaths
+            ]
+            for filepath, future in zip(filepaths, futures):
+                try:
+                    if future is None:
+                        project, splines, warnings = open_project(filepath)
+                    else:
+                        project, warnings = project_from_data(future.result())
+                        splines = project.splines
+                    object_name = Path(filepath).stem or DEFAULT_OBJECT_NAME
+                    curve_object, build_warnings = build_curve_object_from_project(
+                        context,
+                        project,
+                        object_name=object_name,
+                        target_object=None,
+                        splines=splines,
+                    )
+                    imported_objects.append(curve_object)
+                    all_warnings.extend([f"{Path(filepath).name}: {msg}" for msg in warnings + build_warnings])
+                except ValueError as exc:
+                    all_warnings.append(f"{Path(filepath).name}: {exc}")
+                except Exception as exc:
+                    self.report({"ERROR"}, f"SplineMaker import failed: {exc}")
+                    return {"CANCELLED"}
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
         
         if not imported_objects:
             _report_messages(self, {"WARNING"}, all_warnings)
@@ -567,6 +564,23 @@ class IMPORT_SCENE_OT_spline_maker_json(Operator, ImportHelper):
         return {"FINISHED"}
 
 
+class IMPORT_SCENE_OT_spline_maker_live_link(Operator):
+    bl_idname = "import_scene.spline_maker_live_link"
+    bl_label = "Toggle SplineMaker Live Link"
+    bl_description = (
+        "Watch the source files of imported SplineMaker curves and update the curves in place when a file changes"
+    )
+    
+    def execute(self, context: bpy.types.Context):
+        if bpy.app.timers.is_registered(_live_link_tick):
+            bpy.app.timers.unregister(_live_link_tick)
+            self.report({"INFO"}, "SplineMaker live link stopped")
+        else:
+            bpy.app.timers.register(_live_link_tick, first_interval=LIVE_LINK_INTERVAL, persistent=True)
+            self.report({"INFO"}, "SplineMaker live link started")
+        return {"FINISHED"}
+
+
 class EXPORT_SCENE_OT_spline_maker_json(Operator, ExportHelper):
     bl_idname = "export_scene.spline_maker_json"
     bl_label = "Export SplineMaker JSON"
@@ -595,6 +609,24 @@ class EXPORT_SCENE_OT_spline_maker_json(Operator, ExportHelper):
         description="Export curve objects from this collection when set",
         default="",
     )
+    use_compact: BoolProperty(
+        name="Compact",
+        description="Write the JSON without indentation, roughly halving the file size",
+        default=False,
+    )
+    use_precision: BoolProperty(
+        name="Limit Precision",
+        description="Round coordinates, sizes and weights to a fixed number of decimal places",
+        default=False,
+    )
+    precision: IntProperty(
+        name="Decimal Places",
+        description="Decimal places kept when Limit Precision is enabled",
+        default=6,
+        min=0,
+        max=15,
+    )
+    
     def invoke(self, context: bpy.types.Context, event):
         curve_objects = self._resolve_curve_objects(context)
         if not self.filepath:
@@ -609,6 +641,11 @@ class EXPORT_SCENE_OT_spline_maker_json(Operator, ExportHelper):
         layout.prop(self, "use_selection")
         layout.prop(self, "use_active_collection")
         layout.prop_search(self, "collection", bpy.data, "collections")
+        layout.prop(self, "use_compact")
+        layout.prop(self, "use_precision")
+        row = layout.row()
+        row.active = self.use_precision
+        row.prop(self, "precision")
     
     def _resolve_curve_objects(self, context: bpy.types.Context) -> list[bpy.types.Object]:
         return export_objects(
@@ -619,6 +656,12 @@ class EXPORT_SCENE_OT_spline_maker_json(Operator, ExportHelper):
             collection=self.collection,
         )
     
+    def _save_options(self) -> dict:
+        return {
+            "indent": None if self.use_compact else 4,
+            "precision": self.precision if self.use_precision else None,
+        }
+    
     def execute(self, context: bpy.types.Context):
         try:
             curve_objects = self._resolve_curve_objects(context)
@@ -642,7 +685,7 @@ class EXPORT_SCENE_OT_spline_maker_json(Operator, ExportHelper):
                 )
                 if not project.splines:
                     raise ValueError("No valid NURBS splines were available for export")
-                save_project(str(output_path), project)
+                save_project(str(output_path), project, **self._save_options())
                 for curve_object in curve_objects:
                     store_project_metadata(curve_object, project)
                 warnings.extend(object_warnings)
@@ -671,7 +714,7 @@ class EXPORT_SCENE_OT_spline_maker_json(Operator, ExportHelper):
                         warnings.append(f"{curve_object.name}: no valid NURBS splines were available for export")
                         continue
                     
-                    save_project(str(output_path), project)
+                    save_project(str(output_path), project, **self._save_options())
                     store_project_metadata(curve_object, project)
                     export_count += 1
                     warnings.extend([f"{curve_object.name}: {msg}" for msg in object_warnings])
@@ -696,6 +739,10 @@ def menu_func_import(self, _context):
         IMPORT_SCENE_OT_spline_maker_json.bl_idname,
         text="SplineMaker Project (.json)",
     )
+    self.layout.operator(
+        IMPORT_SCENE_OT_spline_maker_live_link.bl_idname,
+        text="Stop SplineMaker Live Link" if bpy.app.timers.is_registered(_live_link_tick) else "Start SplineMaker Live Link",
+    )
 
 
 def menu_func_export(self, _context):
@@ -707,6 +754,7 @@ def menu_func_export(self, _context):
 
 classes = (
     IMPORT_SCENE_OT_spline_maker_json,
+    IMPORT_SCENE_OT_spline_maker_live_link,
     EXPORT_SCENE_OT_spline_maker_json,
 )
 
@@ -719,6 +767,8 @@ def register():
 
 
 def unregister():
+    if bpy.app.timers.is_registered(_live_link_tick):
+        bpy.app.timers.unregister(_live_link_tick)
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
     for cls in reversed(classes):
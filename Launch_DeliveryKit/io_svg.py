@@ -1,8 +1,10 @@
+import hashlib
 import math
 import os
-import re
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+import struct
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable
 
 import bpy
@@ -10,153 +12,60 @@ from bpy_extras.io_utils import ExportHelper, ImportHelper
 from mathutils import Matrix, Vector
 
 try:
-    from .io_common import EXPORT_BATCH_MODES, export_objects, object_export_path
+    import numpy as np
 except ImportError:
-    from io_common import EXPORT_BATCH_MODES, export_objects, object_export_path
+    np = None
 
-
-EPS = 1.0e-9
-
-
-def vadd(a, b):
-    return tuple(x + y for x, y in zip(a, b))
-
-
-def vsub(a, b):
-    return tuple(x - y for x, y in zip(a, b))
-
-
-def vmul(a, s):
-    return tuple(x * s for x in a)
-
-
-def vdot(a, b):
-    return sum(x * y for x, y in zip(a, b))
-
-
-def vlen(a):
-    return math.sqrt(max(0.0, vdot(a, a)))
-
-
-def vnorm(a):
-    length = vlen(a)
-    if length < EPS:
-        return tuple(0.0 for _ in a)
-    return vmul(a, 1.0 / length)
+try:
+    from .curve_math import (
+        EPS, BoundsAccumulator, FitCache, SvgInstanceGroup, evaluate_nurbs_control, fit_cache_key, fit_nurbs_control,
+        fit_polyline, flat_coords, frame_filepath, iter_svg_subpaths, reuse_svg_file, simplify_polyline,
+        svg_subpaths_from_rows, svg_xy, write_svg,
+    )
+    from .io_common import EXPORT_BATCH_MODES, export_objects, object_export_path, process_pool, worker_function
+except ImportError:
+    from curve_math import (
+        EPS, BoundsAccumulator, FitCache, SvgInstanceGroup, evaluate_nurbs_control, fit_cache_key, fit_nurbs_control,
+        fit_polyline, flat_coords, frame_filepath, iter_svg_subpaths, reuse_svg_file, simplify_polyline,
+        svg_subpaths_from_rows, svg_xy, write_svg,
+    )
+    from io_common import EXPORT_BATCH_MODES, export_objects, object_export_path, process_pool, worker_function
 
 
-def vlerp(a, b, t):
-    return tuple((1.0 - t) * x + t * y for x, y in zip(a, b))
+def nurbs_point_weight(point):
+    return float(getattr(point, "weight", point.co[3] if len(point.co) > 3 else 1.0))
 
 
-def is_same_point(a, b, eps=1.0e-7):
-    return vlen(vsub(a, b)) <= eps
+def transform_coords(coords, matrix=None):
+    if matrix is None:
+        return coords
+    m = np.array(matrix, dtype=np.float64)
+    return coords @ m[:3, :3].T + m[:3, 3]
 
 
-def bezier_point(p0, p1, p2, p3, t):
-    u = 1.0 - t
-    return vadd(
-        vadd(vmul(p0, u * u * u), vmul(p1, 3.0 * u * u * t)),
-        vadd(vmul(p2, 3.0 * u * t * t), vmul(p3, t * t * t)),
-    )
+def spline_point_arrays(spline, matrix=None):
+    count = len(spline.points)
+    co = np.empty(count * 4, dtype=np.float32)
+    spline.points.foreach_get("co", co)
+    co = co.reshape(count, 4).astype(np.float64)
+    return transform_coords(co[:, :3], matrix), co[:, 3]
 
 
-def chord_parameters(points):
-    distances = [0.0]
-    total = 0.0
-    for i in range(1, len(points)):
-        total += vlen(vsub(points[i], points[i - 1]))
-        distances.append(total)
-    if total < EPS:
-        return [i / max(1, len(points) - 1) for i in range(len(points))]
-    return [d / total for d in distances]
-
-
-def generate_bezier(points, params, left_tangent, right_tangent):
-    p0 = points[0]
-    p3 = points[-1]
-    c00 = c01 = c11 = x0 = x1 = 0.0
-
-    for point, u in zip(points, params):
-        b0 = (1.0 - u) ** 3
-        b1 = 3.0 * u * (1.0 - u) ** 2
-        b2 = 3.0 * u * u * (1.0 - u)
-        b3 = u ** 3
-        a1 = vmul(left_tangent, b1)
-        a2 = vmul(right_tangent, b2)
-        tmp = vsub(point, vadd(vmul(p0, b0 + b1), vmul(p3, b2 + b3)))
-        c00 += vdot(a1, a1)
-        c01 += vdot(a1, a2)
-        c11 += vdot(a2, a2)
-        x0 += vdot(a1, tmp)
-        x1 += vdot(a2, tmp)
-
-    det = c00 * c11 - c01 * c01
-    alpha_l = alpha_r = 0.0
-    if abs(det) > EPS:
-        alpha_l = (x0 * c11 - x1 * c01) / det
-        alpha_r = (c00 * x1 - c01 * x0) / det
-
-    seg_len = vlen(vsub(p3, p0))
-    if alpha_l < EPS or alpha_r < EPS:
-        alpha_l = alpha_r = seg_len / 3.0
-
-    return (p0, vadd(p0, vmul(left_tangent, alpha_l)), vadd(p3, vmul(right_tangent, alpha_r)), p3)
-
-
-def max_bezier_error(points, curve, params):
-    max_error = -1.0
-    split = len(points) // 2
-    for i in range(1, len(points) - 1):
-        error = vlen(vsub(bezier_point(*curve, params[i]), points[i]))
-        if error > max_error:
-            max_error = error
-            split = i
-    return max_error, split
-
-
-def fit_cubic_recursive(points, left_tangent, right_tangent, tolerance, out_segments, depth=0):
-    if len(points) == 2:
-        dist = vlen(vsub(points[1], points[0])) / 3.0
-        out_segments.append((points[0], vadd(points[0], vmul(left_tangent, dist)), vadd(points[1], vmul(right_tangent, dist)), points[1]))
-        return
-
-    params = chord_parameters(points)
-    curve = generate_bezier(points, params, left_tangent, right_tangent)
-    error, split = max_bezier_error(points, curve, params)
-    if error <= tolerance or depth >= 24:
-        out_segments.append(curve)
-        return
-
-    center = vnorm(vsub(points[split + 1], points[split - 1]))
-    if vlen(center) < EPS:
-        center = left_tangent
-    fit_cubic_recursive(points[: split + 1], left_tangent, vmul(center, -1.0), tolerance, out_segments, depth + 1)
-    fit_cubic_recursive(points[split:], center, right_tangent, tolerance, out_segments, depth + 1)
-
-
-def fit_cubic(points, tolerance=0.01, cyclic=False):
-    clean = []
-    for p in points:
-        if not clean or not is_same_point(clean[-1], p):
-            clean.append(tuple(float(v) for v in p))
-    if len(clean) < 2:
-        return []
-    if cyclic and not is_same_point(clean[0], clean[-1]):
-        clean.append(clean[0])
-
-    left = vnorm(vsub(clean[1], clean[0]))
-    right = vnorm(vsub(clean[-2], clean[-1]))
-    segments = []
-    fit_cubic_recursive(clean, left, right, max(tolerance, 1.0e-5), segments)
-    return segments
-
-
-def nurbs_point_weight(point):
-    return float(getattr(point, "weight", point.co[3] if len(point.co) > 3 else 1.0))
+def bezier_point_arrays(spline, matrix=None):
+    points = spline.bezier_points
+    count = len(points)
+    arrays = []
+    for name in ("co", "handle_left", "handle_right"):
+        values = np.empty(count * 3, dtype=np.float32)
+        points.foreach_get(name, values)
+        arrays.append(transform_coords(values.reshape(count, 3).astype(np.float64), matrix))
+    return arrays
 
 
 def spline_points(spline, matrix=None, dims=3):
+    if np is not None:
+        coords, weights = spline_point_arrays(spline, matrix)
+        return [(tuple(co), w) for co, w in zip(coords[:, :dims].tolist(), weights.tolist())]
     result = []
     for p in spline.points:
         co = Vector((p.co[0], p.co[1], p.co[2]))
@@ -166,61 +75,11 @@ def spline_points(spline, matrix=None, dims=3):
     return result
 
 
-def make_knot_vector(count, degree, endpoint=False, cyclic=False):
-    if cyclic:
-        total = count + degree
-        return [float(i) for i in range(total + degree + 1)], float(degree), float(count + degree)
-    if endpoint:
-        interior = max(0, count - degree - 1)
-        return [0.0] * (degree + 1) + [float(i + 1) for i in range(interior)] + [float(interior + 1)] * (degree + 1), 0.0, float(interior + 1)
-    knots = [float(i) for i in range(count + degree + 1)]
-    return knots, float(degree), float(count)
-
-
-def deboor_rational(control, degree, knots, u):
-    n = len(control) - 1
-    if u >= knots[n + 1]:
-        span = n
-    else:
-        span = degree
-        for i in range(degree, n + 1):
-            if knots[i] <= u < knots[i + 1]:
-                span = i
-                break
-
-    d = []
-    for j in range(degree + 1):
-        point, weight = control[span - degree + j]
-        d.append([point[k] * weight for k in range(len(point))] + [weight])
-
-    for r in range(1, degree + 1):
-        for j in range(degree, r - 1, -1):
-            i = span - degree + j
-            denom = knots[i + degree + 1 - r] - knots[i]
-            alpha = 0.0 if abs(denom) < EPS else (u - knots[i]) / denom
-            d[j] = [(1.0 - alpha) * d[j - 1][k] + alpha * d[j][k] for k in range(len(d[j]))]
-
-    w = d[degree][-1]
-    if abs(w) < EPS:
-        return tuple(d[degree][:-1])
-    return tuple(v / w for v in d[degree][:-1])
-
-
 def evaluate_nurbs_spline(spline, matrix=None, dims=3, samples=None):
     control = spline_points(spline, matrix, dims)
-    count = len(control)
-    if count < 2:
-        return []
-    degree = max(1, min(int(spline.order_u) - 1, count - 1))
-    if spline.use_cyclic_u:
-        control = control + control[:degree]
-    knots, start, end = make_knot_vector(count, degree, bool(spline.use_endpoint_u), bool(spline.use_cyclic_u))
-    sample_count = samples or max(24, count * max(8, int(spline.order_u) * 6))
-    pts = []
-    for i in range(sample_count + 1):
-        u = start + (end - start) * (i / sample_count)
-        pts.append(deboor_rational(control, degree, knots, u))
-    return pts
+    return evaluate_nurbs_control(
+        control, spline.order_u, bool(spline.use_cyclic_u), bool(spline.use_endpoint_u), samples, bool(spline.use_bezier_u)
+    )
 
 
 def all_weights_equal(spline):
@@ -230,11 +89,16 @@ def all_weights_equal(spline):
     return all(abs(nurbs_point_weight(p) - first) < 1.0e-6 for p in spline.points)
 
 
+def nurbs_fit_job(spline, matrix=None, dims=3, tolerance=0.01):
+    control = spline_points(spline, matrix, dims)
+    return (
+        control, int(spline.order_u), bool(spline.use_cyclic_u), bool(spline.use_endpoint_u), float(tolerance),
+        bool(spline.use_bezier_u),
+    )
+
+
 def nurbs_to_bezier_segments(spline, matrix=None, dims=3, tolerance=0.01):
-    direct_possible = int(spline.order_u) < 4 and all_weights_equal(spline)
-    samples = evaluate_nurbs_spline(spline, matrix, dims)
-    tol = tolerance * (0.25 if direct_possible else 1.0)
-    return fit_cubic(samples, tol, bool(spline.use_cyclic_u)), bool(spline.use_cyclic_u)
+    return fit_nurbs_control(*nurbs_fit_job(spline, matrix, dims, tolerance))
 
 
 def bezier_segments_from_spline(spline, matrix=None, dims=3):
@@ -242,6 +106,12 @@ def bezier_segments_from_spline(spline, matrix=None, dims=3):
     if not points:
         return [], False
     total = len(points) if spline.use_cyclic_u else len(points) - 1
+    if np is not None:
+        co, left, right = bezier_point_arrays(spline, matrix)
+        a = np.arange(total)
+        b = (a + 1) % len(points)
+        stacked = np.stack((co[a], right[a], left[b], co[b]), axis=1)[:, :, :dims]
+        return [tuple(tuple(p) for p in seg) for seg in stacked.tolist()], bool(spline.use_cyclic_u)
     segments = []
     for i in range(total):
         a = points[i]
@@ -258,6 +128,9 @@ def bezier_segments_from_spline(spline, matrix=None, dims=3):
 
 
 def poly_points_from_spline(spline, matrix=None, dims=3):
+    if np is not None:
+        coords, _weights = spline_point_arrays(spline, matrix)
+        return [tuple(co) for co in coords[:, :dims].tolist()], bool(spline.use_cyclic_u)
     points = []
     for p in spline.points:
         v = Vector((p.co[0], p.co[1], p.co[2]))
@@ -274,13 +147,21 @@ def add_bezier_spline(curve, segments, cyclic=False):
     spline = curve.splines.new("BEZIER")
     spline.bezier_points.add(point_count - 1)
     spline.use_cyclic_u = cyclic
-    for i, bp in enumerate(spline.bezier_points):
+    # Enum properties can't be bulk-assigned, set handle types before coordinates so nothing is recalculated
+    for bp in spline.bezier_points:
         bp.handle_left_type = "FREE"
         bp.handle_right_type = "FREE"
-        bp.co = Vector(segments[i][0] if i < len(segments) else segments[-1][3])
-    for i, seg in enumerate(segments):
-        spline.bezier_points[i].handle_right = Vector(seg[1])
-        spline.bezier_points[(i + 1) % point_count].handle_left = Vector(seg[2])
+    co = [seg[0] for seg in segments]
+    right = [seg[1] for seg in segments]
+    if cyclic:
+        left = [segments[-1][2]] + [seg[2] for seg in segments[:-1]]
+    else:
+        co.append(segments[-1][3])
+        left = [co[0]] + [seg[2] for seg in segments]
+        right.append(co[-1])
+    spline.bezier_points.foreach_set("co", flat_coords(co))
+    spline.bezier_points.foreach_set("handle_left", flat_coords(left))
+    spline.bezier_points.foreach_set("handle_right", flat_coords(right))
     return spline
 
 
@@ -290,8 +171,7 @@ def add_poly_spline(curve, points, cyclic=False):
     spline = curve.splines.new("POLY")
     spline.points.add(len(points) - 1)
     spline.use_cyclic_u = cyclic
-    for p, co in zip(spline.points, points):
-        p.co = (co[0], co[1], co[2] if len(co) > 2 else 0.0, 1.0)
+    spline.points.foreach_set("co", flat_coords(points, 1.0))
     return spline
 
 
@@ -307,6 +187,24 @@ def add_nurbs_segment(curve, segment):
     return spline
 
 
+def add_nurbs_spline(curve, segments, cyclic=False):
+    # One order 4 spline in "Bezier" knot mode, the knot multiplicity reproduces every segment exactly
+    if not segments:
+        return None
+    if cyclic:
+        points = [p for i, seg in enumerate(segments) for p in (segments[i - 1][2], seg[0], seg[1])]
+    else:
+        points = [segments[0][0]] + [p for seg in segments for p in seg[1:]]
+    spline = curve.splines.new("NURBS")
+    spline.points.add(len(points) - 1)
+    spline.points.foreach_set("co", flat_coords(points, 1.0))
+    spline.use_cyclic_u = cyclic
+    spline.use_bezier_u = True
+    spline.use_endpoint_u = not cyclic
+    spline.order_u = 4
+    return spline
+
+
 def active_curve_objects(context):
     curves = [ob for ob in context.selected_objects if ob.type == "CURVE"]
     if context.object and context.object.type == "CURVE" and context.object not in curves:
@@ -314,12 +212,125 @@ def active_curve_objects(context):
     return curves
 
 
-class CURVE_OT_derive_bezier_from_nurbs(bpy.types.Operator):
+DERIVE_TIME_SLICE = 0.05
+
+
+class CurveDeriveModal:
+    # Shared driver for the Derive operators. Invoked from the UI they run modally in time slices with progress
+    # and Esc to cancel, which restores every curve they touched from a copy taken before its first change.
+    # execute() still converts everything at once so redo and scripted calls behave as before.
+    # Subclasses provide convert_spline(curve, spline) and result_label().
+    source_type = "NURBS"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(context.object and context.object.type == "CURVE")
+
+    def derive_begin(self, context, keep_backups=False):
+        self._original_mode = context.object.mode
+        if self._original_mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+        self._queue = deque()
+        seen = set()
+        for obj in active_curve_objects(context):
+            curve = obj.data
+            if curve.as_pointer() in seen:
+                continue
+            seen.add(curve.as_pointer())
+            self._queue.extend((curve, spline) for spline in curve.splines if spline.type == self.source_type)
+        self._total = len(self._queue)
+        self._keep_backups = keep_backups
+        self._backups = {}
+        self._timer = None
+        self._converted = self._splines = self._points = 0
+        self._start = time.perf_counter()
+
+    def derive_step(self, deadline=None):
+        # Returns True once the queue is empty
+        while self._queue:
+            curve, spline = self._queue.popleft()
+            if self._keep_backups and curve.as_pointer() not in self._backups:
+                self._backups[curve.as_pointer()] = (curve, curve.copy())
+            self._points += len(spline.bezier_points if spline.type == "BEZIER" else spline.points)
+            self._converted += self.convert_spline(curve, spline)
+            self._splines += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return not self._queue
+
+    def derive_cleanup(self, context):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+            context.window_manager.progress_end()
+            context.workspace.status_text_set(None)
+        if self._original_mode != "OBJECT":
+            bpy.ops.object.mode_set(mode=self._original_mode)
+
+    def derive_finish(self, context):
+        for _curve, backup in self._backups.values():
+            bpy.data.curves.remove(backup)
+        self._backups = {}
+        self.derive_cleanup(context)
+        elapsed = max(time.perf_counter() - self._start, 1.0e-9)
+        self.report(
+            {"INFO"},
+            f"Derived {self._converted} {self.result_label()} in {elapsed:.2f}s "
+            f"({self._splines / elapsed:.0f} splines/s, {self._points / elapsed:.0f} points/s)",
+        )
+
+    def derive_rollback(self, context):
+        for curve, backup in self._backups.values():
+            name = curve.name
+            curve.user_remap(backup)
+            bpy.data.curves.remove(curve)
+            backup.name = name
+        restored = len(self._backups)
+        self._backups = {}
+        self.derive_cleanup(context)
+        self.report({"WARNING"}, f"Cancelled, restored {restored} curve(s)")
+
+    def invoke(self, context, event):
+        self.derive_begin(context, keep_backups=True)
+        if not self._queue:
+            self.derive_finish(context)
+            return {"FINISHED"}
+        wm = context.window_manager
+        wm.progress_begin(0, self._total)
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type in {"ESC", "RIGHTMOUSE"}:
+            self.derive_rollback(context)
+            return {"CANCELLED"}
+        if event.type != "TIMER":
+            return {"RUNNING_MODAL"}
+        done = self.derive_step(time.perf_counter() + DERIVE_TIME_SLICE)
+        processed = self._total - len(self._queue)
+        context.window_manager.progress_update(processed)
+        context.workspace.status_text_set(f"{self.bl_label}: {processed}/{self._total} spline(s), Esc to cancel")
+        if done:
+            self.derive_finish(context)
+            return {"FINISHED"}
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        self.derive_begin(context)
+        self.derive_step()
+        self.derive_finish(context)
+        return {"FINISHED"}
+
+
+class CURVE_OT_derive_bezier_from_nurbs(CurveDeriveModal, bpy.types.Operator):
     bl_idname = "curve.derive_bezier_from_nurbs"
     bl_label = "Derive Bezier from NURBS"
     bl_description = "Replace NURBS splines with sparse Bezier splines while preserving the evaluated curve shape"
     bl_options = {"REGISTER", "UNDO"}
 
+    source_type = "NURBS"
+
     tolerance: bpy.props.FloatProperty(
         name="Fit Tolerance",
         description="Maximum fitting error in Blender units",
@@ -329,151 +340,304 @@ class CURVE_OT_derive_bezier_from_nurbs(bpy.types.Operator):
         precision=4,
     )
 
-    @classmethod
-    def poll(cls, context):
-        return bool(context.object and context.object.type == "CURVE")
+    def convert_spline(self, curve, spline):
+        segments, cyclic = nurbs_to_bezier_segments(spline, None, 3, self.tolerance)
+        curve.splines.remove(spline)
+        add_bezier_spline(curve, segments, cyclic)
+        return 1
 
-    def execute(self, context):
-        original_mode = context.object.mode
-        if original_mode != "OBJECT":
-            bpy.ops.object.mode_set(mode="OBJECT")
-        converted = 0
-        for obj in active_curve_objects(context):
-            curve = obj.data
-            existing = list(curve.splines)
-            for spline in existing:
-                if spline.type != "NURBS":
-                    continue
-                segments, cyclic = nurbs_to_bezier_segments(spline, None, 3, self.tolerance)
-                curve.splines.remove(spline)
-                add_bezier_spline(curve, segments, cyclic)
-                converted += 1
-        if original_mode != "OBJECT":
-            bpy.ops.object.mode_set(mode=original_mode)
-        self.report({"INFO"}, f"Derived {converted} Bezier spline(s) from NURBS")
-        return {"FINISHED"}
+    def result_label(self):
+        return "Bezier spline(s) from NURBS"
 
 
-class CURVE_OT_derive_nurbs_from_bezier(bpy.types.Operator):
+class CURVE_OT_derive_nurbs_from_bezier(CurveDeriveModal, bpy.types.Operator):
     bl_idname = "curve.derive_nurbs_from_bezier"
     bl_label = "Derive NURBS from Bezier"
     bl_description = "Replace Bezier splines with exact cubic NURBS segments"
     bl_options = {"REGISTER", "UNDO"}
 
-    @classmethod
-    def poll(cls, context):
-        return bool(context.object and context.object.type == "CURVE")
+    source_type = "BEZIER"
 
-    def execute(self, context):
-        original_mode = context.object.mode
-        if original_mode != "OBJECT":
-            bpy.ops.object.mode_set(mode="OBJECT")
-        converted = 0
-        for obj in active_curve_objects(context):
-            curve = obj.data
-            existing = list(curve.splines)
-            for spline in existing:
-                if spline.type != "BEZIER":
-                    continue
-                segments, _cyclic = bezier_segments_from_spline(spline, None, 3)
-                curve.splines.remove(spline)
-                for segment in segments:
-                    add_nurbs_segment(curve, segment)
-                    converted += 1
-        if original_mode != "OBJECT":
-            bpy.ops.object.mode_set(mode=original_mode)
-        self.report({"INFO"}, f"Derived {converted} NURBS segment(s) from Bezier")
-        return {"FINISHED"}
+    output_mode: bpy.props.EnumProperty(
+        name="Output",
+        description="How each Bezier spline is rebuilt as NURBS",
+        items=(
+            ("SEGMENTS", "Segments", "One 4-point NURBS spline per Bezier segment"),
+            ("SPLINE", "Single Spline", "One multi-knot NURBS spline per Bezier spline"),
+        ),
+        default="SEGMENTS",
+    )
 
+    def convert_spline(self, curve, spline):
+        segments, cyclic = bezier_segments_from_spline(spline, None, 3)
+        curve.splines.remove(spline)
+        if self.output_mode == "SPLINE":
+            return 1 if add_nurbs_spline(curve, segments, cyclic) is not None else 0
+        for segment in segments:
+            add_nurbs_segment(curve, segment)
+        return len(segments)
 
-def svg_number(v):
-    if abs(v) < 1.0e-9:
-        v = 0.0
-    return f"{v:.6g}"
+    def result_label(self):
+        if self.output_mode == "SPLINE":
+            return "NURBS spline(s) from Bezier"
+        return "NURBS segment(s) from Bezier"
 
 
-def svg_xy(point, scale=1.0):
-    return point[0] * scale, -point[1] * scale
+FIT_CACHE = FitCache()
 
 
-def path_from_poly(points, cyclic=False, scale=1.0):
-    if not points:
-        return ""
-    x, y = svg_xy(points[0], scale)
-    parts = [f"M {svg_number(x)} {svg_number(y)}"]
-    for point in points[1:]:
-        x, y = svg_xy(point, scale)
-        parts.append(f"L {svg_number(x)} {svg_number(y)}")
-    if cyclic:
-        parts.append("Z")
-    return " ".join(parts)
+def fit_cache_path():
+    if not bpy.data.filepath:
+        return None
+    return os.path.splitext(bpy.path.abspath(bpy.data.filepath))[0] + ".svgfit.json"
 
 
-def path_from_beziers(segments, cyclic=False, scale=1.0):
-    if not segments:
-        return ""
-    x, y = svg_xy(segments[0][0], scale)
-    parts = [f"M {svg_number(x)} {svg_number(y)}"]
-    for p0, p1, p2, p3 in segments:
-        x1, y1 = svg_xy(p1, scale)
-        x2, y2 = svg_xy(p2, scale)
-        x3, y3 = svg_xy(p3, scale)
-        parts.append(f"C {svg_number(x1)} {svg_number(y1)} {svg_number(x2)} {svg_number(y2)} {svg_number(x3)} {svg_number(y3)}")
-    if cyclic:
-        parts.append("Z")
-    return " ".join(parts)
+def svg_transform(matrix, coordinate_scale=100.0):
+    # SVG matrix(a b c d e f) placing local geometry like matrix does, or None when local Z leaks into X/Y
+    if abs(matrix[0][2]) > EPS or abs(matrix[1][2]) > EPS:
+        return None
+    return (
+        matrix[0][0], -matrix[1][0], -matrix[0][1], matrix[1][1],
+        matrix[0][3] * coordinate_scale, -matrix[1][3] * coordinate_scale,
+    )
 
 
-def export_svg(filepath, objects, tolerance=0.01, coordinate_scale=100.0, view_box_mode="SCENE_ORIGIN"):
-    paths = []
-    bounds = []
-    coordinate_scale = max(float(coordinate_scale), EPS)
-    for obj in objects:
-        if obj.type != "CURVE":
-            continue
-        matrix = obj.matrix_world
-        for spline in obj.data.splines:
+def curve_geometry_key(curve):
+    digest = hashlib.sha1()
+    for spline in curve.splines:
+        digest.update(
+            f"{spline.type}:{spline.use_cyclic_u}:{spline.order_u}:{spline.use_endpoint_u}:{spline.use_bezier_u};".encode()
+        )
+        if spline.type == "BEZIER":
+            points, names, size = spline.bezier_points, ("co", "handle_left", "handle_right"), 3
+        else:
+            points, names, size = spline.points, ("co",), 4
+        for name in names:
+            if np is not None:
+                values = np.empty(len(points) * size, dtype=np.float32)
+                points.foreach_get(name, values)
+                digest.update(values.tobytes())
+            else:
+                values = [0.0] * (len(points) * size)
+                points.foreach_get(name, values)
+                digest.update(struct.pack(f"<{len(values)}f", *values))
+    return digest.hexdigest()
+
+
+def svg_sources(objects, tolerance=0.01, coordinate_scale=100.0, deduplicate=False):
+    # Each source is (object, matrix, tolerance, group). Shapes shared by several objects are fitted once in
+    # local space (matrix None) and group lists the <use> transforms, otherwise group is None.
+    curves = [obj for obj in objects if obj.type == "CURVE"]
+    groups = {}
+    if deduplicate:
+        keys = {}
+        for obj in curves:
+            transform = svg_transform(obj.matrix_world, coordinate_scale)
+            if transform is None:
+                continue
+            pointer = obj.data.as_pointer()
+            if pointer not in keys:
+                keys[pointer] = curve_geometry_key(obj.data)
+            groups.setdefault(keys[pointer], []).append((obj, transform))
+    shared = {}
+    for instances in groups.values():
+        if len(instances) > 1:
+            for obj, _transform in instances:
+                shared[obj.name] = instances
+    sources = []
+    placed = {}
+    for obj in curves:
+        instances = shared.get(obj.name)
+        if instances is None:
+            sources.append((obj, obj.matrix_world, tolerance, None))
+        elif instances[0][0] is obj:
+            transforms = [transform for _obj, transform in instances]
+            # Frobenius norm bounds the largest stretch of each placement, so fits stay within tolerance in world space
+            scale = max(max(math.sqrt(a * a + b * b + c * c + d * d) for a, b, c, d, _e, _f in transforms), EPS)
+            group = SvgInstanceGroup(f"shape-{len(sources)}", transforms, scale, [len(sources)])
+            placed[obj.name] = group
+            sources.append((obj, None, tolerance / scale, group))
+        else:
+            # Later placements keep the object's place in the paint order, svg_shapes() emits their <use> there
+            placed[instances[0][0].name].positions.append(len(sources))
+    return sources
+
+
+def queue_nurbs_fits(sources, executor=None, cache=None):
+    # Submit every uncached NURBS fit up front, keyed by (object name, spline index) for svg_shapes()
+    fits = {}
+    fit = worker_function("curve_math", "fit_nurbs_control")
+    for obj, matrix, tolerance, _group in sources:
+        for index, spline in enumerate(obj.data.splines):
+            if spline.type != "NURBS":
+                continue
+            job = nurbs_fit_job(spline, matrix, 3, tolerance)
+            key = fit_cache_key(*job) if cache is not None else None
+            result = cache.get(key) if cache is not None else None
+            fits[(obj.name, index)] = (result, None, None) if result is not None else (None, executor.submit(fit, *job), key)
+    return fits
+
+
+def svg_shapes(sources, cache=None, fits=None, poly_tolerance=0.0, fit_poly=False):
+    # poly_tolerance > 0 simplifies POLY splines, fit_poly replaces them with Bezier fits of their smooth runs.
+    # Placements of a shared shape after its first come through as ("USE", transform, False, group) just before
+    # the source they preceded in the object order.
+    uses = {}
+    for _obj, _matrix, _tolerance, group in sources:
+        if group is not None:
+            for position, transform in zip(group.positions[1:], group.transforms[1:]):
+                uses.setdefault(position, []).append((transform, group))
+    for position, (obj, matrix, tolerance, group) in enumerate(sources):
+        for transform, use_group in uses.pop(position, ()):
+            yield "USE", transform, False, use_group
+        local_poly_tolerance = poly_tolerance / group.scale if group is not None else poly_tolerance
+        for index, spline in enumerate(obj.data.splines):
             if spline.type == "BEZIER":
                 segments, cyclic = bezier_segments_from_spline(spline, matrix, 3)
-                d = path_from_beziers(segments, cyclic, coordinate_scale)
-                pts = [p for seg in segments for p in (seg[0], seg[1], seg[2], seg[3])]
+                yield "BEZIER", segments, cyclic, group
             elif spline.type == "POLY":
                 pts, cyclic = poly_points_from_spline(spline, matrix, 3)
-                d = path_from_poly(pts, cyclic, coordinate_scale)
+                if fit_poly and local_poly_tolerance > 0.0 and len(pts) > 2:
+                    yield "BEZIER", fit_polyline(pts, local_poly_tolerance, cyclic), cyclic, group
+                else:
+                    yield "POLY", simplify_polyline(pts, local_poly_tolerance, cyclic), cyclic, group
             elif spline.type == "NURBS":
-                segments, cyclic = nurbs_to_bezier_segments(spline, matrix, 3, tolerance)
-                d = path_from_beziers(segments, cyclic, coordinate_scale)
-                pts = [p for seg in segments for p in (seg[0], seg[1], seg[2], seg[3])]
+                queued = fits.pop((obj.name, index), None) if fits is not None else None
+                if queued is not None:
+                    result, future, key = queued
+                    if future is not None:
+                        result = future.result()
+                        if cache is not None:
+                            cache.store(key, result)
+                else:
+                    job = nurbs_fit_job(spline, matrix, 3, tolerance)
+                    key = fit_cache_key(*job) if cache is not None else None
+                    result = cache.get(key) if cache is not None else None
+                    if result is None:
+                        result = fit_nurbs_control(*job)
+                        if cache is not None:
+                            cache.store(key, result)
+                yield ("BEZIER",) + result + (group,)
+    for transform, use_group in uses.pop(len(sources), ()):
+        yield "USE", transform, False, use_group
+
+
+def add_svg_bounds(bounds, coords, coordinate_scale=100.0, transforms=None):
+    # transforms are the SVG matrix(a b c d e f) placements of a shared shape, None for world space coords
+    for a, b, c, d, e, f in transforms or ((1.0, 0.0, 0.0, 1.0, 0.0, 0.0),):
+        if np is not None:
+            xs = coords[:, 0] * coordinate_scale
+            ys = coords[:, 1] * -coordinate_scale
+            xs, ys = a * xs + c * ys + e, b * xs + d * ys + f
+            bounds.add_extent(float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max()))
+        else:
+            bounds.add_points(
+                (a * x + c * y + e, b * x + d * y + f) for x, y in (svg_xy(p, coordinate_scale) for p in coords)
+            )
+
+
+def svg_bounds(sources, coordinate_scale=100.0):
+    # Cheap first pass over the splines, nothing is fitted here. NURBS splines contribute their control polygon,
+    # which contains the curve for positive weights, so their viewBox can be looser than the fitted paths.
+    bounds = BoundsAccumulator()
+    for obj, matrix, _tolerance, group in sources:
+        transforms = group.transforms if group is not None else None
+        for spline in obj.data.splines:
+            if spline.type == "BEZIER":
+                count = len(spline.bezier_points)
+                if count < (1 if spline.use_cyclic_u else 2):
+                    continue
+                if np is not None:
+                    co, left, right = bezier_point_arrays(spline, matrix)
+                    if not spline.use_cyclic_u:
+                        left = left[1:]
+                        right = right[:-1]
+                    coords = np.concatenate((co, left, right))
+                else:
+                    segments, _cyclic = bezier_segments_from_spline(spline, matrix, 3)
+                    coords = [p for seg in segments for p in seg]
+            elif spline.type in {"POLY", "NURBS"}:
+                if len(spline.points) < (1 if spline.type == "POLY" else 2):
+                    continue
+                if np is not None:
+                    coords, _weights = spline_point_arrays(spline, matrix)
+                else:
+                    coords = [co for co, _weight in spline_points(spline, matrix, 3)]
             else:
                 continue
-            if d:
-                paths.append(d)
-                bounds.extend(svg_xy(p, coordinate_scale) for p in pts)
+            add_svg_bounds(bounds, coords, coordinate_scale, transforms)
+    return bounds
+
 
-    if not paths:
+def export_svg(
+    filepath, objects, tolerance=0.01, coordinate_scale=100.0, view_box_mode="SCENE_ORIGIN",
+    cache=None, fits=None, compress=False, optimize=False, deduplicate=False, sources=None,
+    poly_tolerance=0.0, fit_poly=False,
+):
+    coordinate_scale = max(float(coordinate_scale), EPS)
+    if sources is None:
+        sources = svg_sources(objects, tolerance, coordinate_scale, deduplicate)
+    bounds = svg_bounds(sources, coordinate_scale)
+    if bounds.empty:
         raise ValueError("No curve splines were found to export")
+    shapes = svg_shapes(sources, cache, fits, poly_tolerance, fit_poly)
+    return write_svg(filepath, shapes, bounds, coordinate_scale, view_box_mode, compress, optimize, deduplicate)
+
 
-    min_x = min(p[0] for p in bounds)
-    min_y = min(p[1] for p in bounds)
-    max_x = max(p[0] for p in bounds)
-    max_y = max(p[1] for p in bounds)
-    if view_box_mode == "SCENE_ORIGIN":
-        min_x = min(min_x, 0.0)
-        min_y = min(min_y, 0.0)
-        max_x = max(max_x, 0.0)
-        max_y = max(max_y, 0.0)
-    width = max(max_x - min_x, 1.0)
-    height = max(max_y - min_y, 1.0)
-    root = ET.Element("svg", {
-        "xmlns": "http://www.w3.org/2000/svg",
-        "version": "1.1",
-        "viewBox": f"{svg_number(min_x)} {svg_number(min_y)} {svg_number(width)} {svg_number(height)}",
-        "width": svg_number(width),
-        "height": svg_number(height),
-    })
-    for d in paths:
-        ET.SubElement(root, "path", {"d": d, "fill": "none", "stroke": "black", "stroke-width": "1"})
-    ET.ElementTree(root).write(filepath, encoding="utf-8", xml_declaration=True)
+def frame_geometry_key(objects):
+    digest = hashlib.sha1()
+    for obj in objects:
+        if obj.type != "CURVE":
+            continue
+        digest.update(curve_geometry_key(obj.data).encode())
+        digest.update(struct.pack("<16d", *(v for row in obj.matrix_world for v in row)))
+    return digest.hexdigest()
+
+
+def export_svg_sequence(
+    scene, targets, tolerance=0.01, coordinate_scale=100.0, view_box_mode="SCENE_ORIGIN", cache=None, executor=None,
+    compress=False, optimize=False, deduplicate=False, poly_tolerance=0.0, fit_poly=False,
+):
+    # Walks the scene frame range once, writing <target>_<frame>.svg for every (filepath, objects) target.
+    # Frames whose splines and matrices hash the same as the last written one reuse that file. Writing runs on a
+    # single background thread while the next frame is evaluated; only plain Python data is handed to it.
+    coordinate_scale = max(float(coordinate_scale), EPS)
+    original_frame = scene.frame_current
+    previous = {}
+    in_flight = deque()
+    written = reused = saved = 0
+    writer = ThreadPoolExecutor(max_workers=1)
+    try:
+        for frame in range(scene.frame_start, scene.frame_end + 1, max(1, scene.frame_step)):
+            scene.frame_set(frame)
+            for filepath, objects in targets:
+                output_path = frame_filepath(filepath, frame)
+                key = frame_geometry_key(objects)
+                last = previous.get(filepath)
+                if last is not None and last[0] == key:
+                    in_flight.append(writer.submit(reuse_svg_file, last[1], output_path))
+                    reused += 1
+                else:
+                    sources = svg_sources(objects, tolerance, coordinate_scale, deduplicate)
+                    bounds = svg_bounds(sources, coordinate_scale)
+                    if bounds.empty:
+                        raise ValueError("No curve splines were found to export")
+                    fits = queue_nurbs_fits(sources, executor, cache) if executor is not None else None
+                    shapes = list(svg_shapes(sources, cache, fits, poly_tolerance, fit_poly))
+                    in_flight.append(writer.submit(
+                        write_svg, output_path, shapes, bounds, coordinate_scale, view_box_mode, compress, optimize, deduplicate,
+                    ))
+                    previous[filepath] = (key, output_path)
+                    written += 1
+                # Bound the shapes waiting on the writer so long sequences don't pile up in memory
+                while len(in_flight) > 2:
+                    saved += in_flight.popleft().result()
+        while in_flight:
+            saved += in_flight.popleft().result()
+    finally:
+        writer.shutdown(wait=True)
+        scene.frame_set(original_frame)
+    return written, reused, saved
 
 
 class EXPORT_CURVE_OT_svg_bezier_nurbs(bpy.types.Operator, ExportHelper):
@@ -482,7 +646,7 @@ class EXPORT_CURVE_OT_svg_bezier_nurbs(bpy.types.Operator, ExportHelper):
     bl_options = {"PRESET"}
 
     filename_ext = ".svg"
-    filter_glob: bpy.props.StringProperty(default="*.svg", options={"HIDDEN"})
+    filter_glob: bpy.props.StringProperty(default="*.svg;*.svgz", options={"HIDDEN"})
     batch_mode: bpy.props.EnumProperty(
         name="Batch Mode",
         description="How multiple resolved curve objects are written",
@@ -524,10 +688,58 @@ class EXPORT_CURVE_OT_svg_bezier_nurbs(bpy.types.Operator, ExportHelper):
         description="How SVG document bounds are calculated",
         items=(
             ("SCENE_ORIGIN", "Scene Origin", "Keep Blender scene origin inside the SVG viewBox"),
-            ("BOUNDS", "Curve Bounds", "Use tight bounds around exported curves"),
+            ("BOUNDS", "Curve Bounds", "Use bounds around exported curves, NURBS curves are bounded by their control points"),
         ),
         default="SCENE_ORIGIN",
     )
+    poly_tolerance: bpy.props.FloatProperty(
+        name="Polyline Tolerance",
+        description="Drop polyline points closer than this to the simplified outline, in Blender units (0 keeps every point)",
+        default=0.0,
+        min=0.0,
+        soft_max=0.1,
+        precision=4,
+    )
+    fit_poly_curves: bpy.props.BoolProperty(
+        name="Fit Curves to Polylines",
+        description="Replace smooth runs of simplified polylines with Bezier curves within the polyline tolerance",
+        default=False,
+    )
+    optimize_paths: bpy.props.BoolProperty(
+        name="Optimize Path Data",
+        description="Write compact path data with relative and shorthand commands, quantized to 0.1 mm",
+        default=False,
+    )
+    use_instancing: bpy.props.BoolProperty(
+        name="Share Repeated Shapes",
+        description="Write curves shared by several objects once in <defs> and place each object with <use>",
+        default=False,
+    )
+    use_compression: bpy.props.BoolProperty(
+        name="Compress (.svgz)",
+        description="Write gzip-compressed SVG files",
+        default=False,
+    )
+    use_frame_sequence: bpy.props.BoolProperty(
+        name="Frame Sequence",
+        description="Export every frame of the scene range to numbered files, reusing the previous file for unchanged frames",
+        default=False,
+    )
+    use_parallel: bpy.props.BoolProperty(
+        name="Parallel Fitting",
+        description="Fit NURBS splines in worker processes, one per CPU core",
+        default=False,
+    )
+    use_fit_cache: bpy.props.BoolProperty(
+        name="Reuse Fits",
+        description="Skip fitting NURBS splines that are unchanged since an earlier export",
+        default=True,
+    )
+    use_disk_cache: bpy.props.BoolProperty(
+        name="Store Fits on Disk",
+        description="Keep fit results in a .svgfit.json file next to the saved .blend file so they survive restarts",
+        default=False,
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -538,6 +750,17 @@ class EXPORT_CURVE_OT_svg_bezier_nurbs(bpy.types.Operator, ExportHelper):
         layout.prop(self, "tolerance")
         layout.prop(self, "coordinate_scale")
         layout.prop(self, "view_box_mode")
+        layout.prop(self, "poly_tolerance")
+        layout.prop(self, "fit_poly_curves")
+        layout.prop(self, "optimize_paths")
+        layout.prop(self, "use_instancing")
+        layout.prop(self, "use_compression")
+        layout.prop(self, "use_frame_sequence")
+        layout.prop(self, "use_parallel")
+        layout.prop(self, "use_fit_cache")
+        row = layout.row()
+        row.enabled = self.use_fit_cache
+        row.prop(self, "use_disk_cache")
 
     def execute(self, context):
         objects = export_objects(
@@ -550,199 +773,105 @@ class EXPORT_CURVE_OT_svg_bezier_nurbs(bpy.types.Operator, ExportHelper):
         if not objects:
             self.report({"ERROR"}, "No curve objects were found for export")
             return {"CANCELLED"}
+        cache = FIT_CACHE if self.use_fit_cache else None
+        cache_path = fit_cache_path() if cache is not None and self.use_disk_cache else None
+        if cache is not None:
+            cache.reset_stats()
+            if cache_path:
+                cache.load(cache_path)
+        filepath = self.filepath
+        extension = ".svgz" if self.use_compression else self.filename_ext
+        if self.use_compression and not filepath.lower().endswith(".svgz"):
+            filepath = os.path.splitext(filepath)[0] + extension
+        executor = None
+        if self.use_parallel and any(spline.type == "NURBS" for obj in objects for spline in obj.data.splines):
+            executor = process_pool()
         try:
             if self.batch_mode == "OFF":
-                export_svg(self.filepath, objects, self.tolerance, self.coordinate_scale, self.view_box_mode)
-                export_count = 1
+                targets = [(filepath, objects)]
+            else:
+                targets = [(object_export_path(filepath, obj, extension), [obj]) for obj in objects]
+            reused = 0
+            if self.use_frame_sequence:
+                export_count, reused, saved = export_svg_sequence(
+                    context.scene, targets, self.tolerance, self.coordinate_scale, self.view_box_mode, cache, executor,
+                    self.use_compression, self.optimize_paths, self.use_instancing, self.poly_tolerance, self.fit_poly_curves,
+                )
             else:
+                batches = [
+                    (output_path, batch, svg_sources(batch, self.tolerance, self.coordinate_scale, self.use_instancing))
+                    for output_path, batch in targets
+                ]
+                # Queue every fit up front so workers stay busy while earlier paths are written
+                fits = None
+                if executor is not None:
+                    fits = queue_nurbs_fits([source for _path, _batch, sources in batches for source in sources], executor, cache)
+                options = (
+                    self.tolerance, self.coordinate_scale, self.view_box_mode, cache, fits,
+                    self.use_compression, self.optimize_paths, self.use_instancing,
+                )
+                saved = 0
                 export_count = 0
-                for obj in objects:
-                    output_path = object_export_path(self.filepath, obj, self.filename_ext)
-                    export_svg(output_path, [obj], self.tolerance, self.coordinate_scale, self.view_box_mode)
+                for output_path, batch, sources in batches:
+                    saved += export_svg(
+                        output_path, batch, *options, sources=sources,
+                        poly_tolerance=self.poly_tolerance, fit_poly=self.fit_poly_curves,
+                    )
                     export_count += 1
         except Exception as exc:
             self.report({"ERROR"}, str(exc))
             return {"CANCELLED"}
-        self.report({"INFO"}, f"Exported {export_count} SVG file(s)")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        message = f"Exported {export_count} SVG file(s)"
+        if reused:
+            message += f" and reused {reused} unchanged frame(s)"
+        if self.optimize_paths:
+            message += f", path data {saved} byte(s) smaller"
+        if cache is not None:
+            if cache_path and cache.dirty:
+                try:
+                    cache.save(cache_path)
+                except OSError as exc:
+                    self.report({"WARNING"}, f"Could not write fit cache: {exc}")
+            message += f" (fit cache: {cache.hits} hit(s), {cache.misses} miss(es))"
+        self.report({"INFO"}, message)
         return {"FINISHED"}
 
 
-TOKEN_RE = re.compile(r"[AaCcHhLlMmQqSsTtVvZz]|[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?")
-
-
-@dataclass
-class SvgSubpath:
-    kind: str
-    points: list
-    segments: list
-    cyclic: bool = False
-
-
-def parse_float(tokens, index):
-    return float(tokens[index]), index + 1
-
-
-def svg_to_blender(p):
-    return (float(p[0]), -float(p[1]), 0.0)
-
-
-def reflect(point, around):
-    return (2.0 * around[0] - point[0], 2.0 * around[1] - point[1])
-
-
-def parse_path_data(d):
-    tokens = TOKEN_RE.findall(d.replace(",", " "))
-    paths = []
-    i = 0
-    cmd = None
-    current = (0.0, 0.0)
-    start = (0.0, 0.0)
-    last_cubic = None
-    last_quad = None
-    sub = None
-
-    def close_subpath():
-        nonlocal sub, current
-        if sub and (sub.points or sub.segments):
-            if sub.cyclic and sub.kind == "BEZIER" and sub.segments and not is_same_point(svg_to_blender(current), svg_to_blender(start)):
-                p0 = svg_to_blender(current)
-                p3 = svg_to_blender(start)
-                sub.segments.append((p0, vlerp(p0, p3, 1 / 3), vlerp(p0, p3, 2 / 3), p3))
-            paths.append(sub)
-        sub = None
-
-    def promote_to_bezier():
-        if not sub or sub.kind == "BEZIER":
-            return
-        pts = sub.points
-        sub.kind = "BEZIER"
-        sub.segments = []
-        for a, b in zip(pts, pts[1:]):
-            sub.segments.append((a, vlerp(a, b, 1 / 3), vlerp(a, b, 2 / 3), b))
-
-    while i < len(tokens):
-        if re.match(r"^[A-Za-z]$", tokens[i]):
-            cmd = tokens[i]
-            i += 1
-        if cmd is None:
-            break
-        absolute = cmd.isupper()
-        c = cmd.upper()
-        if c == "Z":
-            if sub:
-                sub.cyclic = True
-            current = start
-            close_subpath()
-            cmd = None
-            last_cubic = last_quad = None
-            continue
-
-        def next_point():
-            nonlocal i
-            x, i2 = parse_float(tokens, i)
-            y, i3 = parse_float(tokens, i2)
-            i = i3
-            if not absolute:
-                return (current[0] + x, current[1] + y)
-            return (x, y)
-
-        if c == "M":
-            close_subpath()
-            current = next_point()
-            start = current
-            sub = SvgSubpath("POLY", [svg_to_blender(current)], [])
-            cmd = "L" if absolute else "l"
-            last_cubic = last_quad = None
-            continue
-        if sub is None:
-            sub = SvgSubpath("POLY", [svg_to_blender(current)], [])
-        if c in {"L", "H", "V"}:
-            while i < len(tokens) and not re.match(r"^[A-Za-z]$", tokens[i]):
-                if c == "L":
-                    target = next_point()
-                elif c == "H":
-                    x, i = parse_float(tokens, i)
-                    target = (x, current[1]) if absolute else (current[0] + x, current[1])
-                else:
-                    y, i = parse_float(tokens, i)
-                    target = (current[0], y) if absolute else (current[0], current[1] + y)
-                if sub.kind == "POLY":
-                    sub.points.append(svg_to_blender(target))
-                else:
-                    p0 = svg_to_blender(current)
-                    p3 = svg_to_blender(target)
-                    sub.segments.append((p0, vlerp(p0, p3, 1 / 3), vlerp(p0, p3, 2 / 3), p3))
-                current = target
-            last_cubic = last_quad = None
-            continue
-        if c in {"C", "S", "Q", "T"}:
-            if sub.kind == "POLY":
-                promote_to_bezier()
-            while i < len(tokens) and not re.match(r"^[A-Za-z]$", tokens[i]):
-                if c == "C":
-                    c1 = next_point()
-                    c2 = next_point()
-                    target = next_point()
-                    last_cubic = c2
-                    last_quad = None
-                elif c == "S":
-                    c1 = reflect(last_cubic, current) if last_cubic else current
-                    c2 = next_point()
-                    target = next_point()
-                    last_cubic = c2
-                    last_quad = None
-                else:
-                    q1 = reflect(last_quad, current) if c == "T" and last_quad else next_point()
-                    target = next_point()
-                    c1 = (current[0] + (2.0 / 3.0) * (q1[0] - current[0]), current[1] + (2.0 / 3.0) * (q1[1] - current[1]))
-                    c2 = (target[0] + (2.0 / 3.0) * (q1[0] - target[0]), target[1] + (2.0 / 3.0) * (q1[1] - target[1]))
-                    last_quad = q1
-                    last_cubic = None
-                sub.segments.append(tuple(svg_to_blender(p) for p in (current, c1, c2, target)))
-                current = target
-            continue
-        if c == "A":
-            raise ValueError("SVG arc commands are not supported; convert arcs to paths first")
-    close_subpath()
-    return paths
+IMPORT_BATCH_SIZE = 256
 
 
-def parse_points_attribute(text):
-    nums = [float(v) for v in re.findall(r"[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?", text or "")]
-    return [svg_to_blender((nums[i], nums[i + 1])) for i in range(0, len(nums) - 1, 2)]
+def build_svg_subpaths(curve, subpaths):
+    for sub in subpaths:
+        if sub.kind == "POLY":
+            add_poly_spline(curve, sub.points, sub.cyclic)
+        else:
+            add_bezier_spline(curve, sub.segments, sub.cyclic)
 
 
-def import_svg(filepath):
-    tree = ET.parse(filepath)
-    root = tree.getroot()
+def import_svg(filepath, subpaths=None):
     curve = bpy.data.curves.new(os.path.splitext(os.path.basename(filepath))[0] or "SVG Curves", "CURVE")
     curve.dimensions = "2D"
     curve.resolution_u = 24
 
-    def local_name(element):
-        return element.tag.rsplit("}", 1)[-1]
-
     imported = 0
-    for elem in root.iter():
-        name = local_name(elem)
-        if name == "path" and elem.get("d"):
-            for sub in parse_path_data(elem.get("d")):
-                if sub.kind == "POLY":
-                    add_poly_spline(curve, sub.points, sub.cyclic)
-                else:
-                    add_bezier_spline(curve, sub.segments, sub.cyclic)
-                imported += 1
-        elif name in {"polyline", "polygon"}:
-            pts = parse_points_attribute(elem.get("points", ""))
-            add_poly_spline(curve, pts, name == "polygon")
-            imported += 1
-        elif name == "line":
-            pts = [svg_to_blender((elem.get("x1", 0), elem.get("y1", 0))), svg_to_blender((elem.get("x2", 0), elem.get("y2", 0)))]
-            add_poly_spline(curve, pts, False)
-            imported += 1
-
-    if imported == 0:
-        raise ValueError("No supported SVG path, line, polyline, or polygon elements found")
+    batch = []
+    try:
+        for sub in iter_svg_subpaths(filepath) if subpaths is None else subpaths:
+            batch.append(sub)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                build_svg_subpaths(curve, batch)
+                imported += len(batch)
+                batch.clear()
+        build_svg_subpaths(curve, batch)
+        imported += len(batch)
+        if imported == 0:
+            raise ValueError("No supported SVG path, line, polyline, or polygon elements found")
+    except Exception:
+        bpy.data.curves.remove(curve)
+        raise
 
     obj = bpy.data.objects.new(curve.name, curve)
     bpy.context.collection.objects.link(obj)
@@ -758,14 +887,53 @@ class IMPORT_CURVE_OT_svg_bezier_nurbs(bpy.types.Operator, ImportHelper):
 
     filename_ext = ".svg"
     filter_glob: bpy.props.StringProperty(default="*.svg", options={"HIDDEN"})
+    files: bpy.props.CollectionProperty(
+        name="Files",
+        type=bpy.types.OperatorFileListElement,
+        options={"HIDDEN", "SKIP_SAVE"},
+    )
+    directory: bpy.props.StringProperty(subtype="DIR_PATH", options={"HIDDEN"})
+
+    def _iter_filepaths(self):
+        if self.files:
+            return [os.path.join(self.directory, entry.name) for entry in self.files]
+        return [self.filepath]
 
     def execute(self, context):
-        try:
-            obj = import_svg(self.filepath)
-        except Exception as exc:
-            self.report({"ERROR"}, str(exc))
+        filepaths = self._iter_filepaths()
+        start = time.perf_counter()
+        imported = []
+        failures = []
+        if len(filepaths) == 1:
+            try:
+                imported.append(import_svg(filepaths[0]))
+            except Exception as exc:
+                failures.append(f"{os.path.basename(filepaths[0])}: {exc}")
+        else:
+            # Files are parsed concurrently, curve objects are created here in file order so names and creation
+            # order don't depend on which parse finishes first
+            with process_pool() as executor:
+                parse = worker_function("curve_math", "parse_svg_file")
+                futures = [executor.submit(parse, filepath) for filepath in filepaths]
+                for filepath, future in zip(filepaths, futures):
+                    try:
+                        imported.append(import_svg(filepath, svg_subpaths_from_rows(future.result())))
+                    except Exception as exc:
+                        failures.append(f"{os.path.basename(filepath)}: {exc}")
+        elapsed = time.perf_counter() - start
+
+        if not imported:
+            for message in failures[:-1]:
+                self.report({"WARNING"}, message)
+            self.report({"ERROR"}, failures[-1] if failures else "No SVG files were imported")
             return {"CANCELLED"}
-        self.report({"INFO"}, f"Imported SVG curve object: {obj.name}")
+        for message in failures:
+            self.report({"WARNING"}, message)
+        path_count = sum(len(obj.data.splines) for obj in imported)
+        if len(imported) == 1 and len(filepaths) == 1:
+            self.report({"INFO"}, f"Imported SVG curve object: {imported[0].name} ({path_count} path(s) in {elapsed:.2f}s)")
+        else:
+            self.report({"INFO"}, f"Imported {len(imported)} of {len(filepaths)} SVG file(s) ({path_count} path(s) in {elapsed:.2f}s)")
         return {"FINISHED"}
 
 
@@ -0,0 +1,610 @@
+# SplineMaker project model and JSON reader/writer. Kept free of bpy so projects can be loaded by worker
+# processes and benchmarked outside Blender.
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_OBJECT_NAME = "SplineMakerCurves"
+DEFAULT_PROJECT_VERSION = 1
+DEFAULT_CURVE_SMOOTHNESS = 0.5
+DEFAULT_ACTION_AREA_SIZE = 0.1
+DEFAULT_RESOLUTION_U = 8
+DEFAULT_ORDER_U = 4
+MIN_POINT_COUNT = 2
+STREAM_THRESHOLD_BYTES = 32 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def spline_to_blender_coords(x: float, y: float, z: float) -> tuple[float, float, float]:
+    return float(x), -float(z), float(y)
+
+
+def blender_to_spline_coords(x: float, y: float, z: float) -> tuple[float, float, float]:
+    return float(x), float(z), -float(y)
+
+
+@dataclass
+class SplineMakerPoint:
+    x: float
+    y: float
+    z: float
+    size: float = DEFAULT_ACTION_AREA_SIZE
+    weight: float = 1.0
+
+
+def float_array(values=()) -> array:
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    if np is not None and isinstance(values, np.ndarray):
+        return array("d", np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return array("d", values)
+
+
+def _column_property(name: str) -> property:
+    def get(self) -> float:
+        return getattr(self._spline, name)[self._index]
+
+    def set(self, value: float) -> None:
+        getattr(self._spline, name)[self._index] = float(value)
+
+    return property(get, set)
+
+
+class SplinePointView:
+    # A single point of a SplineMakerSpline, backed by its columns rather than a copy
+    __slots__ = ("_spline", "_index")
+
+    def __init__(self, spline: SplineMakerSpline, index: int) -> None:
+        self._spline = spline
+        self._index = index
+
+    x = _column_property("x")
+    y = _column_property("y")
+    z = _column_property("z")
+    size = _column_property("size")
+    weight = _column_property("weight")
+
+    def __repr__(self) -> str:
+        return f"SplinePointView(x={self.x!r}, y={self.y!r}, z={self.z!r}, size={self.size!r}, weight={self.weight!r})"
+
+
+class SplinePoints(Sequence):
+    # Fixed-length view over a spline's points, item assignment copies a SplineMakerPoint into the columns
+    __slots__ = ("_spline",)
+
+    def __init__(self, spline: SplineMakerSpline) -> None:
+        self._spline = spline
+
+    def __len__(self) -> int:
+        return spline_point_count(self._spline)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [SplinePointView(self._spline, i) for i in range(*index.indices(len(self)))]
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("spline point index out of range")
+        return SplinePointView(self._spline, index)
+
+    def __setitem__(self, index: int, point: SplineMakerPoint) -> None:
+        view = self[index]
+        view.x, view.y, view.z, view.size, view.weight = point.x, point.y, point.z, point.size, point.weight
+
+
+@dataclass(init=False)
+class SplineMakerSpline:
+    # Point data lives in contiguous array("d") columns, 40 bytes a point instead of a dataclass each. The
+    # points property is a view for callers that still work point by point, reads and writes go straight to the
+    # columns. It cannot change the point count, assign a new list for that.
+    x: array
+    y: array
+    z: array
+    size: array
+    weight: array
+    cyclic: bool = False
+    order_u: int = DEFAULT_ORDER_U
+    resolution_u: int = DEFAULT_RESOLUTION_U
+
+    def __init__(
+        self,
+        points: list[SplineMakerPoint] | None = None,
+        cyclic: bool = False,
+        order_u: int = DEFAULT_ORDER_U,
+        resolution_u: int = DEFAULT_RESOLUTION_U,
+        *,
+        columns: tuple | None = None,
+    ) -> None:
+        self.cyclic = cyclic
+        self.order_u = order_u
+        self.resolution_u = resolution_u
+        if columns is not None:
+            self.set_columns(*columns)
+        else:
+            self.points = points or []
+
+    def set_columns(self, x, y, z, size, weight) -> None:
+        self.x, self.y, self.z = float_array(x), float_array(y), float_array(z)
+        self.size, self.weight = float_array(size), float_array(weight)
+
+    @property
+    def points(self) -> SplinePoints:
+        return SplinePoints(self)
+
+    @points.setter
+    def points(self, points: Iterable[SplineMakerPoint]) -> None:
+        # Read once up front, a generator would otherwise be used up by the first column
+        points = list(points)
+        self.set_columns(
+            [p.x for p in points],
+            [p.y for p in points],
+            [p.z for p in points],
+            [p.size for p in points],
+            [p.weight for p in points],
+        )
+
+
+@dataclass
+class SplineMakerProject:
+    project_name: str = ""
+    source_path: str = ""
+    version: int = DEFAULT_PROJECT_VERSION
+    curve_smoothness: float = DEFAULT_CURVE_SMOOTHNESS
+    action_area_left: float = DEFAULT_ACTION_AREA_SIZE
+    action_area_right: float = DEFAULT_ACTION_AREA_SIZE
+    splines: list[SplineMakerSpline] = field(default_factory=list)
+
+
+def spline_point_count(spline: SplineMakerSpline) -> int:
+    return len(spline.x)
+
+
+def spline_point_rows(spline: SplineMakerSpline):
+    return zip(spline.x, spline.y, spline.z, spline.size, spline.weight)
+
+
+def spline_to_blender_arrays(spline: SplineMakerSpline):
+    # Flat (x, -z, y, w) co and radius sequences ready for foreach_set, spline_to_blender_coords applied to
+    # whole arrays instead of point by point
+    if np is not None:
+        co = np.empty((spline_point_count(spline), 4), dtype=np.float32)
+        co[:, 0] = np.frombuffer(spline.x, dtype=np.float64)
+        co[:, 1] = -np.frombuffer(spline.z, dtype=np.float64)
+        co[:, 2] = np.frombuffer(spline.y, dtype=np.float64)
+        co[:, 3] = np.maximum(np.frombuffer(spline.weight, dtype=np.float64), 0.001)
+        return co.ravel(), np.maximum(np.frombuffer(spline.size, dtype=np.float64), 0.001).astype(np.float32)
+    co = [v for x, y, z, w in zip(spline.x, spline.y, spline.z, spline.weight) for v in (x, -z, y, max(0.001, w))]
+    return co, [max(0.001, size) for size in spline.size]
+
+
+def blender_to_spline_arrays(co, radii) -> tuple:
+    # Inverse of spline_to_blender_arrays, flat (x, y, z, w) co and radius buffers from foreach_get become
+    # (x, y, z, size, weight) columns with blender_to_spline_coords applied to whole arrays
+    if np is not None:
+        co = np.asarray(co, dtype=np.float64).reshape(-1, 4)
+        radii = np.asarray(radii, dtype=np.float64)
+        return co[:, 0], co[:, 2], -co[:, 1], np.maximum(radii, 0.001), np.maximum(co[:, 3], 0.001)
+    return (
+        [float(v) for v in co[0::4]],
+        [float(v) for v in co[2::4]],
+        [-float(v) for v in co[1::4]],
+        [max(0.001, float(r)) for r in radii],
+        [max(0.001, float(w)) for w in co[3::4]],
+    )
+
+
+def clamp_order(order_u: int, point_count: int) -> int:
+    if point_count <= 0:
+        return MIN_POINT_COUNT
+    return max(MIN_POINT_COUNT, min(int(order_u), int(point_count)))
+
+
+def _coerce_float(value, default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float(default)
+
+
+def _coerce_int(value, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return int(default)
+
+
+def _coerce_bool(value, default: bool = False) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in {"true", "1", "yes", "on"}:
+            return True
+        if lowered in {"false", "0", "no", "off"}:
+            return False
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return default
+
+
+def _apply_project_field(project: SplineMakerProject, key: str, value, warnings: list[str]) -> None:
+    if key == "version":
+        project.version = max(1, _coerce_int(value, DEFAULT_PROJECT_VERSION))
+    elif key == "curve_smoothness":
+        project.curve_smoothness = _coerce_float(value, DEFAULT_CURVE_SMOOTHNESS)
+    elif key == "action_area_sizes":
+        if isinstance(value, dict):
+            project.action_area_left = max(
+                0.001,
+                _coerce_float(value.get("left"), DEFAULT_ACTION_AREA_SIZE),
+            )
+            project.action_area_right = max(
+                0.001,
+                _coerce_float(value.get("right"), DEFAULT_ACTION_AREA_SIZE),
+            )
+        else:
+            warnings.append("action_area_sizes is not an object; default sizes were used")
+            project.action_area_left = DEFAULT_ACTION_AREA_SIZE
+            project.action_area_right = DEFAULT_ACTION_AREA_SIZE
+
+
+def _clamp_size_column(column: array) -> None:
+    # In place max(0.001, v), NaN included
+    if np is not None:
+        if len(column):
+            view = np.frombuffer(column, dtype=np.float64)
+            np.fmax(view, 0.001, out=view)
+        return
+    for i, v in enumerate(column):
+        if not v >= 0.001:
+            column[i] = 0.001
+
+
+def _point_columns(spline_index: int, points_data: list, warnings: list[str]) -> tuple:
+    # Well-formed points convert with one typed-array build per field. A missing key or non-numeric value
+    # anywhere in the spline drops to the per-point coercion below, which also produces the warnings.
+    try:
+        columns = tuple(
+            array("d", [point[key] for point in points_data])
+            for key in ("x", "y", "z", "size", "weight")
+        )
+    except (KeyError, TypeError, OverflowError):
+        pass
+    else:
+        _clamp_size_column(columns[3])
+        _clamp_size_column(columns[4])
+        return columns
+    
+    xs, ys, zs, sizes, weights = array("d"), array("d"), array("d"), array("d"), array("d")
+    for point_index, point_data in enumerate(points_data):
+        if not isinstance(point_data, dict):
+            warnings.append(
+                f"Spline {spline_index} point {point_index} is not an object and was skipped"
+            )
+            continue
+        
+        xs.append(_coerce_float(point_data.get("x"), 0.0))
+        ys.append(_coerce_float(point_data.get("y"), 0.0))
+        zs.append(_coerce_float(point_data.get("z"), 0.0))
+        sizes.append(max(0.001, _coerce_float(point_data.get("size"), DEFAULT_ACTION_AREA_SIZE)))
+        weights.append(max(0.001, _coerce_float(point_data.get("weight"), 1.0)))
+    return xs, ys, zs, sizes, weights
+
+
+def _parse_spline(spline_index: int, spline_data, warnings: list[str]) -> SplineMakerSpline | None:
+    if not isinstance(spline_data, dict):
+        warnings.append(f"Spline {spline_index} is not an object and was skipped")
+        return None
+    
+    points_data = spline_data.get("points", [])
+    if not isinstance(points_data, list):
+        warnings.append(f"Spline {spline_index} points are not an array and were skipped")
+        return None
+    
+    columns = _point_columns(spline_index, points_data, warnings)
+    point_count = len(columns[0])
+    if point_count < MIN_POINT_COUNT:
+        warnings.append(
+            f"Spline {spline_index} has fewer than {MIN_POINT_COUNT} valid points and was skipped"
+        )
+        return None
+    
+    return SplineMakerSpline(
+        columns=columns,
+        cyclic=_coerce_bool(spline_data.get("cyclic"), False),
+        order_u=clamp_order(
+            _coerce_int(spline_data.get("order_u"), DEFAULT_ORDER_U),
+            point_count,
+        ),
+        resolution_u=max(
+            1,
+            _coerce_int(spline_data.get("resolution_u"), DEFAULT_RESOLUTION_U),
+        ),
+    )
+
+
+class _JsonStream:
+    # Incremental reader over a text handle. Values are decoded one at a time with raw_decode, a value that
+    # runs past the end of the buffer triggers a refill that doubles in size, so a large spline costs about
+    # two parses rather than one per chunk.
+    def __init__(self, handle, filepath: str, chunk_size: int) -> None:
+        self.handle = handle
+        self.filepath = filepath
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+
+    def error(self, message: str, pos: int | None = None) -> ValueError:
+        pos = self.pos if pos is None else pos
+        return ValueError(f"JSON parse error in {self.filepath}: {message} (char {self.offset + pos})")
+
+    def fill(self, size: int) -> bool:
+        if self.pos:
+            self.offset += self.pos
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        try:
+            chunk = self.handle.read(size)
+        except OSError as exc:
+            raise ValueError(f"Could not read JSON file: {self.filepath}") from exc
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        # Next non-whitespace character, empty at the end of the input
+        while True:
+            self.pos = _JSON_WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill(self.chunk_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                if self.eof:
+                    raise self.error(exc.msg, exc.pos) from exc
+            else:
+                # A number is only complete once a delimiter follows it, "3." at the buffer end decodes as 3
+                if self.eof or not isinstance(value, (int, float)) or self.buffer[end:end + 1] in _JSON_DELIMITERS:
+                    self.pos = end
+                    return value
+            self.fill(size)
+            size = max(size, len(self.buffer))
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DELIMITERS = frozenset(",]} \t\n\r")
+
+
+def _stream_splines(path: Path, project: SplineMakerProject, warnings: list[str], chunk_size: int):
+    try:
+        handle = path.open("r", encoding="utf-8")
+    except OSError as exc:
+        raise ValueError(f"Could not read JSON file: {path}") from exc
+    with handle:
+        stream = _JsonStream(handle, str(path), chunk_size)
+        if stream.peek() != "{":
+            raise ValueError("SplineMaker JSON root must be an object")
+        stream.pos += 1
+        first = True
+        while stream.peek() != "}":
+            if not first:
+                stream.expect(",")
+            first = False
+            key = stream.value()
+            if not isinstance(key, str):
+                raise stream.error("Expecting property name")
+            stream.expect(":")
+            if key != "splines":
+                _apply_project_field(project, key, stream.value(), warnings)
+                continue
+            if stream.peek() != "[":
+                raise ValueError("SplineMaker JSON field 'splines' must be an array")
+            stream.pos += 1
+            spline_index = 0
+            while stream.peek() != "]":
+                if spline_index:
+                    stream.expect(",")
+                spline = _parse_spline(spline_index, stream.value(), warnings)
+                spline_index += 1
+                if spline is not None:
+                    yield spline
+            stream.pos += 1
+        stream.pos += 1
+        if stream.peek():
+            raise stream.error("Extra data")
+
+
+def open_project(
+    filepath: str,
+    stream_threshold: int = STREAM_THRESHOLD_BYTES,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> tuple[SplineMakerProject, Iterable[SplineMakerSpline], list[str]]:
+    # Files of stream_threshold bytes or more are parsed lazily: splines is then a generator that fills in the
+    # project fields and warnings as it is consumed, and project.splines stays empty. Smaller files are loaded
+    # at once and splines is project.splines.
+    path = Path(filepath)
+    project = SplineMakerProject(project_name=path.stem, source_path=str(path))
+    warnings: list[str] = []
+    try:
+        size = path.stat().st_size
+        if size >= stream_threshold:
+            return project, _stream_splines(path, project, warnings, chunk_size), warnings
+        raw_data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ValueError(f"JSON file not found: {filepath}") from exc
+    except OSError as exc:
+        raise ValueError(f"Could not read JSON file: {filepath}") from exc
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"JSON parse error in {filepath}: {exc}") from exc
+    
+    if not isinstance(raw_data, dict):
+        raise ValueError("SplineMaker JSON root must be an object")
+    
+    for key in ("version", "curve_smoothness", "action_area_sizes"):
+        if key in raw_data:
+            _apply_project_field(project, key, raw_data[key], warnings)
+    
+    splines_data = raw_data.get("splines", [])
+    if not isinstance(splines_data, list):
+        raise ValueError("SplineMaker JSON field 'splines' must be an array")
+    
+    for spline_index, spline_data in enumerate(splines_data):
+        spline = _parse_spline(spline_index, spline_data, warnings)
+        if spline is not None:
+            project.splines.append(spline)
+    
+    return project, project.splines, warnings
+
+
+def load_project(filepath: str, stream_threshold: int = STREAM_THRESHOLD_BYTES) -> tuple[SplineMakerProject, list[str]]:
+    project, splines, warnings = open_project(filepath, stream_threshold)
+    if splines is not project.splines:
+        project.splines.extend(splines)
+    return project, warnings
+
+
+def load_project_data(filepath: str, stream_threshold: int = STREAM_THRESHOLD_BYTES) -> tuple:
+    # Worker entry point. load_project() as plain tuples and arrays, project_from_data() rebuilds the classes,
+    # so the result unpickles without this module being importable by its top-level name in the caller.
+    project, warnings = load_project(filepath, stream_threshold)
+    fields = (
+        project.project_name, project.source_path, project.version, project.curve_smoothness,
+        project.action_area_left, project.action_area_right,
+    )
+    splines = [
+        ((s.x, s.y, s.z, s.size, s.weight), s.cyclic, s.order_u, s.resolution_u) for s in project.splines
+    ]
+    return fields, splines, warnings
+
+
+def project_from_data(data: tuple) -> tuple[SplineMakerProject, list[str]]:
+    fields, splines, warnings = data
+    project = SplineMakerProject(*fields)
+    project.splines = [
+        SplineMakerSpline(cyclic=cyclic, order_u=order_u, resolution_u=resolution_u, columns=columns)
+        for columns, cyclic, order_u, resolution_u in splines
+    ]
+    return project, warnings
+
+
+def changed_live_links(claims: dict[str, list], stamped_mtime) -> list[tuple[str, object, float]]:
+    # (filepath, owner, mtime) for every file claimed by exactly one owner whose modification time differs from
+    # stamped_mtime(owner). A path claimed by several owners (a combined export) is ambiguous and left alone,
+    # files that can't be stat'ed are skipped until they reappear.
+    changed = []
+    for filepath, owners in claims.items():
+        if len(owners) != 1:
+            continue
+        try:
+            mtime = os.path.getmtime(filepath)
+        except OSError:
+            continue
+        if mtime != stamped_mtime(owners[0]):
+            changed.append((filepath, owners[0], mtime))
+    return changed
+
+
+def json_float(value: float, precision: int | None = None) -> str:
+    # Same text json.dumps produces for a float, optionally rounded to a number of decimal places
+    if value != value:
+        return "NaN"
+    if value in (math.inf, -math.inf):
+        return "Infinity" if value > 0 else "-Infinity"
+    if precision is not None:
+        value = round(value, precision)
+    return repr(value)
+
+
+def write_project_json(handle, project: SplineMakerProject, indent: int | None = 4, precision: int | None = None) -> None:
+    # Streams the project one spline at a time. With the defaults the text matches json.dumps(payload, indent=4)
+    # byte for byte, indent=None writes the compact form with no whitespace.
+    def newline(depth: int) -> str:
+        return "" if indent is None else "\n" + " " * (indent * depth)
+    
+    colon = ":" if indent is None else ": "
+    item = "," + newline(5)
+    point_template = (
+        newline(4) + "{" + newline(5)
+        + item.join(f'"{key}"{colon}%s' for key in ("x", "y", "z", "size", "weight"))
+        + newline(4) + "}"
+    )
+    
+    handle.write(
+        "{" + newline(1)
+        + f'"version"{colon}{max(1, int(project.version))},' + newline(1)
+        + f'"curve_smoothness"{colon}{json_float(float(project.curve_smoothness), precision)},' + newline(1)
+        + f'"splines"{colon}['
+    )
+    written = 0
+    for spline in project.splines:
+        point_count = spline_point_count(spline)
+        if point_count < MIN_POINT_COUNT:
+            continue
+        handle.write(
+            ("," if written else "") + newline(2) + "{" + newline(3)
+            + f'"cyclic"{colon}{"true" if spline.cyclic else "false"},' + newline(3)
+            + f'"order_u"{colon}{clamp_order(spline.order_u, point_count)},' + newline(3)
+            + f'"points"{colon}['
+        )
+        handle.write(",".join(
+            point_template % (
+                json_float(float(x), precision),
+                json_float(float(y), precision),
+                json_float(float(z), precision),
+                json_float(max(0.001, float(size)), precision),
+                json_float(max(0.001, float(weight)), precision),
+            )
+            for x, y, z, size, weight in spline_point_rows(spline)
+        ))
+        handle.write(newline(3) + "]" + newline(2) + "}")
+        written += 1
+    handle.write(
+        (newline(1) if written else "") + "]," + newline(1)
+        + f'"action_area_sizes"{colon}{{' + newline(2)
+        + f'"left"{colon}{json_float(max(0.001, float(project.action_area_left)), precision)},' + newline(2)
+        + f'"right"{colon}{json_float(max(0.001, float(project.action_area_right)), precision)}' + newline(1)
+        + "}" + newline(0) + "}"
+    )
+
+
+def save_project(
+    filepath: str,
+    project: SplineMakerProject,
+    *,
+    indent: int | None = 4,
+    precision: int | None = None,
+) -> None:
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        write_project_json(handle, project, indent, precision)
@@ -0,0 +1,53 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Launch_DeliveryKit"))
+
+from curve_math import parse_path_data
+
+
+def synthetic_path_data(target_bytes, seed=0):
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    while size < target_bytes:
+        x, y = rng.uniform(-500.0, 500.0), rng.uniform(-500.0, 500.0)
+        run = [f"M{x:.4f},{y:.4f}"]
+        for _ in range(rng.randint(20, 200)):
+            command = rng.choice("CcLlSsQHVT")
+            arity = {"C": 6, "L": 2, "S": 4, "Q": 4, "H": 1, "V": 1, "T": 2}[command.upper()]
+            repeat = rng.randint(1, 8)
+            values = " ".join(f"{rng.uniform(-50.0, 50.0):.4f}" for _ in range(arity * repeat))
+            run.append(f"{command}{values}")
+        if rng.random() < 0.5:
+            run.append("Z")
+        chunk = " ".join(run)
+        parts.append(chunk)
+        size += len(chunk) + 1
+    return " ".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time parse_path_data on synthetic SVG path data")
+    parser.add_argument("--megabytes", type=float, default=4.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    d = synthetic_path_data(int(args.megabytes * 1024 * 1024), args.seed)
+    best = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        paths = parse_path_data(d)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    segments = sum(len(p.segments) or len(p.points) for p in paths)
+    print(f"parse_path_data: {len(d) / 1.0e6:.2f} MB, {len(paths)} subpaths, {segments} segments")
+    print(f"best of {args.repeat}: {best:.3f}s ({len(d) / 1.0e6 / best:.2f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
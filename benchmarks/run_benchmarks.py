@@ -0,0 +1,188 @@
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "Launch_DeliveryKit"))
+
+from bench_path_parse import synthetic_path_data
+from curve_math import evaluate_nurbs_control, fit_cubic, parse_path_data
+from splinemaker_project import SplineMakerPoint, SplineMakerProject, SplineMakerSpline, load_project, save_project
+
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+
+
+def random_walk(rng, count, step=0.2):
+    x = y = z = 0.0
+    points = []
+    for _ in range(count):
+        x += rng.uniform(-step, step)
+        y += rng.uniform(-step, step)
+        z += rng.uniform(-step, step) * 0.25
+        points.append((x, y, z))
+    return points
+
+
+def nurbs_fixtures(seed, scale):
+    # Every order from linear to quintic, with uniform and varying weights
+    rng = random.Random(seed)
+    count = max(8, int(200 * scale))
+    fixtures = []
+    for order in (2, 3, 4, 5, 6):
+        for weighted in (False, True):
+            control = [(p, rng.uniform(0.5, 2.0) if weighted else 1.0) for p in random_walk(rng, count)]
+            fixtures.append((control, order, False, True))
+    return fixtures
+
+
+def dense_curve(seed, scale):
+    rng = random.Random(seed)
+    count = max(64, int(20000 * scale))
+    phases = [rng.uniform(0.0, math.tau) for _ in range(4)]
+    points = []
+    for i in range(count):
+        t = i / count * math.tau
+        points.append((
+            3.0 * math.cos(t) + 0.4 * math.cos(5.0 * t + phases[0]) + rng.gauss(0.0, 1.0e-4),
+            3.0 * math.sin(t) + 0.4 * math.sin(7.0 * t + phases[1]) + rng.gauss(0.0, 1.0e-4),
+            0.2 * math.sin(3.0 * t + phases[2]),
+        ))
+    return points
+
+
+def splinemaker_project(seed, scale):
+    rng = random.Random(seed)
+    project = SplineMakerProject(project_name="Benchmark")
+    for _ in range(max(1, int(200 * scale))):
+        points = [
+            SplineMakerPoint(x=x, y=y, z=z, size=rng.uniform(0.05, 0.2), weight=rng.uniform(0.5, 2.0))
+            for x, y, z in random_walk(rng, 500)
+        ]
+        project.splines.append(SplineMakerSpline(points=points, cyclic=rng.random() < 0.3))
+    return project
+
+
+def build_benchmarks(seed, scale, workdir):
+    # name -> (callable, work units per call, unit label)
+    benchmarks = {}
+
+    curve = dense_curve(seed, scale)
+    benchmarks["fit_cubic"] = (lambda: fit_cubic(curve, 0.001), len(curve), "points")
+
+    fixtures = nurbs_fixtures(seed, scale)
+    samples = 32
+
+    def evaluate_all():
+        for control, order, cyclic, endpoint in fixtures:
+            evaluate_nurbs_control(control, order, cyclic, endpoint, len(control) * samples)
+
+    benchmarks["evaluate_nurbs"] = (evaluate_all, sum(len(c) * samples + 1 for c, *_rest in fixtures), "samples")
+
+    d = synthetic_path_data(int(2 * 1024 * 1024 * scale), seed)
+    benchmarks["parse_path_data"] = (lambda: parse_path_data(d), len(d) / 1.0e6, "MB")
+
+    project = splinemaker_project(seed, scale)
+    point_count = sum(len(spline.points) for spline in project.splines)
+    source = os.path.join(workdir, "project.json")
+    save_project(source, project)
+    target = os.path.join(workdir, "saved.json")
+    benchmarks["load_project"] = (lambda: load_project(source), point_count, "points")
+    benchmarks["save_project"] = (lambda: save_project(target, project), point_count, "points")
+    return benchmarks
+
+
+def measure(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    # Separate run for memory, tracemalloc slows allocation-heavy code too much to time alongside it
+    tracemalloc.start()
+    try:
+        func()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            print(f"{name:<18} no baseline entry")
+            continue
+        time_ratio = result["seconds"] / max(reference["seconds"], 1.0e-12)
+        memory_ratio = result["peak_bytes"] / max(reference["peak_bytes"], 1)
+        flags = []
+        if time_ratio > 1.0 + threshold:
+            flags.append("SLOWER")
+        if memory_ratio > 1.0 + threshold:
+            flags.append("MORE MEMORY")
+        if flags:
+            regressions.append(name)
+        print(f"{name:<18} time x{time_ratio:.2f}  peak x{memory_ratio:.2f}  {' '.join(flags) or 'ok'}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the curve math and project I/O kernels on seeded fixtures")
+    parser.add_argument("--scale", type=float, default=1.0, help="Fixture size multiplier")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="*", default=None, help="Run only benchmarks whose names contain these strings")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown or memory growth before failing")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        benchmarks = build_benchmarks(args.seed, args.scale, workdir)
+        for name, (func, units, unit) in benchmarks.items():
+            if args.only and not any(part in name for part in args.only):
+                continue
+            seconds, peak = measure(func, args.repeat)
+            results[name] = {"seconds": seconds, "throughput": units / seconds, "unit": unit, "peak_bytes": peak}
+            print(f"{name:<18} {seconds:8.3f}s  {units / seconds:14,.0f} {unit}/s  peak {peak / 1.0e6:8.2f} MB")
+
+    if args.update_baseline:
+        payload = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "scale": args.scale,
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=4)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --update-baseline to record one")
+        return 0
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    if baseline.get("scale") != args.scale or baseline.get("seed") != args.seed:
+        print("Baseline was recorded with a different --scale or --seed, ratios are not comparable")
+    print(f"Compared with {args.baseline} (threshold {args.threshold:.0%})")
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"Regressed: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+import json
+import math
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Launch_DeliveryKit"))
+
+import curve_math
+from curve_math import FIT_CACHE_FORMAT, BoundsAccumulator, FitCache, fit_cubic, write_svg
+
+
+def noisy_curve(seed, count, dims, closed):
+    rng = random.Random(seed)
+    phases = [rng.uniform(0.0, math.tau) for _ in range(3)]
+    points = []
+    for i in range(count):
+        t = i / count * math.tau if closed else i / (count - 1) * 3.0
+        p = (
+            2.0 * math.cos(t) + 0.3 * math.cos(5.0 * t + phases[0]) + rng.gauss(0.0, 1.0e-3),
+            2.0 * math.sin(t) + 0.3 * math.sin(3.0 * t + phases[1]) + rng.gauss(0.0, 1.0e-3),
+            0.5 * math.sin(2.0 * t + phases[2]),
+        )
+        points.append(p[:dims])
+    return points
+
+
+@pytest.mark.skipif(curve_math.np is None, reason="NumPy kernel not available")
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("dims, cyclic", [(2, False), (3, False), (2, True), (3, True)])
+def test_fit_cubic_array_kernel_matches_scalar(seed, dims, cyclic):
+    points = noisy_curve(seed, 400 + 150 * seed, dims, cyclic)
+    assert len(points) >= curve_math.ARRAY_FIT_MIN_POINTS
+    for tolerance in (0.05, 0.005):
+        scalar = fit_cubic(points, tolerance, cyclic, use_array=False)
+        array = fit_cubic(points, tolerance, cyclic, use_array=True)
+        assert len(array) == len(scalar)
+        for a, b in zip(array, scalar):
+            for pa, pb in zip(a, b):
+                assert len(pa) == len(pb) == dims
+                assert max(abs(x - y) for x, y in zip(pa, pb)) < 1.0e-6
+
+
+@pytest.mark.parametrize("entries", [
+    [],
+    None,
+    {"a": 5},
+    {"a": [1, 2, 3]},
+    {"a": [[[1.0]], True]},
+    {"a": [[[["x", 1.0]] * 4], True]},
+    {"a": [[[[1.0, 2.0]] * 4], "yes"]},
+])
+def test_fit_cache_load_treats_malformed_file_as_miss(tmp_path, entries):
+    path = tmp_path / "fits.svgfit.json"
+    path.write_text(json.dumps({"format": FIT_CACHE_FORMAT, "entries": entries}), encoding="utf-8")
+    cache = FitCache()
+    assert cache.load(str(path)) == 0
+    assert not cache.entries
+
+
+def test_fit_cache_round_trip(tmp_path):
+    path = str(tmp_path / "fits.svgfit.json")
+    cache = FitCache()
+    cache.store("a", ([((0.0, 0.0), (1.0, 1.0), (2.0, 1.0), (3.0, 0.0))], True))
+    cache.save(path)
+    loaded = FitCache()
+    assert loaded.load(path) == 1
+    assert loaded.get("a") == cache.get("a")
+
+
+def svg_test_bounds():
+    bounds = BoundsAccumulator()
+    bounds.add_points([(0.0, 0.0), (100.0, -100.0)])
+    return bounds
+
+
+def test_write_svg_replaces_target_when_complete(tmp_path):
+    path = str(tmp_path / "out.svg")
+    shapes = [("POLY", [(0.0, 0.0, 0.0), (1.0, 1.0, 0.0)], False, None)]
+    write_svg(path, shapes, svg_test_bounds())
+    assert os.listdir(tmp_path) == ["out.svg"]
+    with open(path, encoding="utf-8") as handle:
+        assert handle.read().endswith("</svg>")
+
+
+@pytest.mark.parametrize("name", ["out.svg", "out.svgz"])
+def test_write_svg_failure_keeps_previous_file(tmp_path, name):
+    path = tmp_path / name
+    path.write_bytes(b"previous")
+
+    def shapes():
+        yield "POLY", [(0.0, 0.0, 0.0), (1.0, 1.0, 0.0)], False, None
+        raise RuntimeError("fit failed")
+
+    with pytest.raises(RuntimeError):
+        write_svg(str(path), shapes(), svg_test_bounds())
+    assert os.listdir(tmp_path) == [name]
+    assert path.read_bytes() == b"previous"
+
+
+def test_parse_svg_file_rows_round_trip(tmp_path):
+    path = str(tmp_path / "in.svg")
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('<svg xmlns="http://www.w3.org/2000/svg"><path d="M0 0 L10 10 C1 2 3 4 5 6 Z"/><polyline points="0,0 1,1 2,0"/></svg>')
+    rows = curve_math.parse_svg_file(path)
+    assert all(type(row) is tuple for row in rows)
+    assert curve_math.svg_subpaths_from_rows(rows) == list(curve_math.iter_svg_subpaths(path))
+
+
+def test_write_svg_keeps_use_elements_in_paint_order(tmp_path):
+    path = str(tmp_path / "out.svg")
+    group = curve_math.SvgInstanceGroup("shape-0", [(1, 0, 0, 1, 0, 0), (1, 0, 0, 1, 50, 0)], 1.0, [0, 2])
+    line = [(0.0, 0.0, 0.0), (1.0, 1.0, 0.0)]
+    shapes = [
+        ("POLY", line, False, group),
+        ("POLY", line, False, None),
+        ("USE", group.transforms[1], False, group),
+        ("POLY", line, False, None),
+    ]
+    write_svg(path, shapes, svg_test_bounds(), deduplicate=True)
+    with open(path, encoding="utf-8") as handle:
+        text = handle.read()
+    body = text[text.index("<defs>"):]
+    order = [part.split(" ")[0] for part in body.replace("<", "\n<").split("\n") if part.startswith(("<path", "<use"))]
+    assert order == ["<path", "<use", "<path", "<use", "<path"]
+    assert body.index('matrix(1 0 0 1 50 0)') > body.index("</defs>")
+
+
+def path_points(d):
+    return [[(x, -y) for x, y, _z in sub.points] for sub in curve_math.parse_path_data(d)]
+
+
+def test_parse_path_implicit_repeated_commands():
+    # Extra pairs after M/m are line-tos in the same mode, other commands repeat themselves
+    assert path_points("M0 0 10 0 20 10m5 5 1 1") == [[(0, 0), (10, 0), (20, 10)], [(25, 15), (26, 16)]]
+    assert path_points("M0 0L1 1 2 2h3 1v-1 -1") == [[(0, 0), (1, 1), (2, 2), (5, 2), (6, 2), (6, 1), (6, 0)]]
+    [sub] = curve_math.parse_path_data("M0 0C0 1 1 2 2 2 2 3 3 4 4 4")
+    assert [seg[3][:2] for seg in sub.segments] == [(2, -2), (4, -4)]
+
+
+def test_parse_path_exponents_and_packed_numbers():
+    assert path_points("M1e1 2E-1L-1.5e+1,3e0") == [[(10, 0.2), (-15, 3)]]
+    assert path_points("M1.5.5L.25.75-1-2") == [[(1.5, 0.5), (0.25, 0.75), (-1, -2)]]
+    assert list(curve_math.tokenize_path_data("M0-.5.5e1")) == [("M", [0.0, -0.5, 5.0])]
+
+
+def test_parse_path_arcs_raise_even_with_packed_flags():
+    # Arcs are not supported, compact flags ("0 1120 20") must reach that error rather than a tokenizer failure
+    for d in ("M0 0A10 10 0 1120 20", "M0 0a10,10,0,0,1,20,20", "M0 0A10 10 0 1 1 20 20"):
+        with pytest.raises(ValueError, match="arc"):
+            curve_math.parse_path_data(d)
+
+
+@pytest.mark.parametrize("d", ["M0 0L10 0T20 10", "M0 0C0 5 5 10 10 10T20 10", "M0 0H10T20 10"])
+def test_parse_path_smooth_quadratic_without_previous_quadratic(d):
+    # With no Q before it, T uses the current point as its control point and takes one coordinate pair
+    [sub] = curve_math.parse_path_data(d)
+    p0, c1, c2, p3 = sub.segments[-1]
+    assert p0 == c1 == (10.0, p0[1], 0.0)
+    assert p3 == (20.0, -10.0, 0.0)
+    assert c2[0] == pytest.approx(20.0 + 2.0 / 3.0 * (10.0 - 20.0))
+    assert c2[1] == pytest.approx(-10.0 + 2.0 / 3.0 * (p0[1] + 10.0))
+
+
+def test_parse_path_smooth_quadratic_reflects_previous_quadratic():
+    [sub] = curve_math.parse_path_data("M0 0Q5 10 10 0T20 0")
+    reflected = (15.0, -10.0)
+    p0, c1, _c2, p3 = sub.segments[-1]
+    assert c1[:2] == pytest.approx((p0[0] + 2.0 / 3.0 * (reflected[0] - p0[0]), -2.0 / 3.0 * reflected[1]))
+    assert p3 == (20.0, -0.0, 0.0)
+
+
+def assert_within_step(parsed, expected, step):
+    assert len(parsed) == len(expected)
+    for p, e in zip(parsed, expected):
+        assert abs(p[0] - e[0]) <= step / 2 + 1.0e-9 and abs(p[1] - e[1]) <= step / 2 + 1.0e-9
+
+
+@pytest.mark.parametrize("decimals, scale", [(2, 1.0), (0, 100.0), (4, 0.5)])
+def test_optimized_poly_round_trips_within_quantization(decimals, scale):
+    rng = random.Random(decimals)
+    points = [(rng.uniform(-5, 5), rng.uniform(-5, 5), 0.0)]
+    for _ in range(60):
+        x, y, _z = points[-1]
+        step = rng.uniform(-3, 3)
+        # Mix horizontal, vertical and diagonal moves, some far from the origin so relative form wins
+        points.append(rng.choice([(x + step, y, 0.0), (x, y + step, 0.0), (x + step, y - step, 0.0), (x + 400.0, y, 0.0)]))
+    for cyclic in (False, True):
+        d = curve_math.optimized_path_from_poly(points, cyclic, scale, decimals)
+        [sub] = curve_math.parse_path_data(d)
+        assert sub.cyclic == cyclic
+        assert_within_step([p[:2] for p in sub.points], [(x * scale, y * scale) for x, y, _z in points], 10.0 ** -decimals)
+    assert {"H", "V"} & set(d) and {"h", "v"} & set(d)
+    assert "l" in d or "L" in d
+
+
+def test_optimized_beziers_round_trip_with_smooth_shortcut():
+    rng = random.Random(3)
+    step = 0.01
+
+    def grid():
+        # Values on the quantization grid, so reflected control points stay exact
+        return round(rng.uniform(-4, 4) / step) * step
+
+    segments = []
+    p0 = (grid(), grid(), 0.0)
+    c2 = None
+    for i in range(40):
+        # Every other segment continues smoothly from the previous one, which S (and s) can express
+        c1 = (2 * p0[0] - c2[0], 2 * p0[1] - c2[1], 0.0) if c2 is not None and i % 2 else (grid(), grid(), 0.0)
+        c2 = (grid(), grid(), 0.0)
+        p3 = (grid() + (200.0 if i % 7 == 0 else 0.0), grid(), 0.0)
+        segments.append((p0, c1, c2, p3))
+        p0 = p3
+    d = curve_math.optimized_path_from_beziers(segments, False, 1.0, 2)
+    assert "S" in d or "s" in d
+    assert "C" in d and "c" in d
+    [sub] = curve_math.parse_path_data(d)
+    parsed = [p[:2] for seg in sub.segments for p in seg]
+    expected = [p[:2] for seg in segments for p in seg]
+    assert_within_step(parsed, expected, step)
+
+
+def wavy_polyline(seed, count):
+    rng = random.Random(seed)
+    return [
+        (i * 0.05, math.sin(i * 0.11) + rng.gauss(0.0, 0.02), rng.uniform(-1.0, 1.0))
+        for i in range(count)
+    ]
+
+
+def polyline_distance(point, polyline):
+    return min(curve_math.point_segment_distance(point, a, b) for a, b in zip(polyline, polyline[1:]))
+
+
+@pytest.mark.skipif(curve_math.np is None, reason="NumPy kernel not available")
+@pytest.mark.parametrize("count", [20, curve_math.ARRAY_SIMPLIFY_MIN_POINTS - 1, curve_math.ARRAY_SIMPLIFY_MIN_POINTS, 500])
+@pytest.mark.parametrize("cyclic", [False, True])
+def test_simplify_polyline_array_branch_matches_scalar(monkeypatch, count, cyclic):
+    points = wavy_polyline(count, count)
+    for tolerance in (0.01, 0.1):
+        array_indices = curve_math.simplify_polyline_indices(points, tolerance, cyclic)
+        with monkeypatch.context() as patch:
+            patch.setattr(curve_math, "np", None)
+            scalar_indices = curve_math.simplify_polyline_indices(points, tolerance, cyclic)
+        assert array_indices == scalar_indices
+
+
+@pytest.mark.parametrize("cyclic", [False, True])
+def test_simplify_polyline_stays_within_tolerance(cyclic):
+    points = wavy_polyline(7, 300)
+    tolerance = 0.05
+    indices = curve_math.simplify_polyline_indices(points, tolerance, cyclic)
+    assert 2 < len(indices) < len(points)
+    assert indices[0] == 0
+    kept = [points[i][:2] for i in indices] + ([points[0][:2]] if cyclic else [])
+    for point in points:
+        # Distances are measured in the SVG (XY) plane, Z is ignored
+        assert polyline_distance(point[:2], kept) <= tolerance + 1.0e-9
+
+
+@pytest.mark.parametrize("turn", [45.0, 90.0])
+def test_fit_polyline_keeps_sharp_corners_and_tolerance(turn):
+    # A smooth arc ending along -X, then a straight leg turning by more than the 40 degree corner angle
+    arc = [(math.cos(t) * 2.0, math.sin(t) * 2.0, 0.0) for t in (i * math.pi / 80 for i in range(41))]
+    corner = arc[-1]
+    heading = math.radians(180.0 - turn)
+    step = (0.05 * math.cos(heading), 0.05 * math.sin(heading))
+    leg = [(corner[0] + i * step[0], corner[1] + i * step[1], 0.0) for i in range(1, 40)]
+    points = arc + leg
+    tolerance = 0.01
+    segments = curve_math.fit_polyline(points, tolerance)
+    [index] = [i for i, seg in enumerate(segments) if max(abs(a - b) for a, b in zip(seg[0], corner)) < 1.0e-9]
+    incoming = curve_math.vnorm(curve_math.vsub(segments[index - 1][3], segments[index - 1][2]))
+    outgoing = curve_math.vnorm(curve_math.vsub(segments[index][1], segments[index][0]))
+    # The tangent still breaks at the corner instead of being rounded over
+    assert math.degrees(math.acos(curve_math.vdot(incoming, outgoing))) == pytest.approx(turn, abs=5.0)
+    for segment in segments:
+        for i in range(9):
+            sample = curve_math.bezier_point(*segment, i / 8)
+            assert polyline_distance(sample, points) <= tolerance + 1.0e-9
+
+
+def rational_bezier_point(points, weights, t):
+    basis = [(1 - t) ** 3, 3 * t * (1 - t) ** 2, 3 * t * t * (1 - t), t ** 3]
+    total = sum(b * w for b, w in zip(basis, weights))
+    return tuple(sum(b * w * p[axis] for b, w, p in zip(basis, weights, points)) / total for axis in range(3))
+
+
+def test_bezier_knot_vector_repeats_inner_knots():
+    # (knots, start, end), every segment spans one unit of the parameter
+    assert curve_math.bezier_knot_vector(7, 3, endpoint=True) == ([0, 0, 0, 0, 1, 1, 1, 2, 2, 2, 2], 0, 2)
+    assert curve_math.bezier_knot_vector(6, 3, cyclic=True) == ([0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4], 1, 3)
+
+
+@pytest.mark.parametrize("cyclic, segment_count", [(False, 1), (False, 2), (False, 5), (True, 2), (True, 5)])
+@pytest.mark.parametrize("weighted", [False, True])
+def test_bezier_knot_nurbs_matches_direct_bezier(cyclic, segment_count, weighted):
+    # Order 4 "Bezier" knot splines are cubic Bezier segments, a0 r0 l1 a1 ... (cyclic: l0 a0 r0 l1 a1 r1 ...)
+    rng = random.Random(segment_count * 4 + cyclic * 2 + weighted)
+    count = 3 * segment_count if cyclic else 3 * segment_count + 1
+    control = [
+        (tuple(rng.uniform(-2.0, 2.0) for _ in range(3)), rng.uniform(0.5, 2.0) if weighted else 1.0)
+        for _ in range(count)
+    ]
+    samples_per_segment = 8
+    pts = curve_math.evaluate_nurbs_control(
+        control, 4, cyclic, not cyclic, segment_count * samples_per_segment, bezier=True,
+    )
+    assert len(pts) == segment_count * samples_per_segment + 1
+    indexed = control[1:] + control[:2] if cyclic else control
+    for i, point in enumerate(pts):
+        segment, step = divmod(i, samples_per_segment)
+        if segment == segment_count:
+            segment, step = segment - 1, samples_per_segment
+        span = indexed[3 * segment:3 * segment + 4]
+        expected = rational_bezier_point([p for p, _w in span], [w for _p, w in span], step / samples_per_segment)
+        assert max(abs(a - b) for a, b in zip(point, expected)) < 1.0e-9
+    if not weighted:
+        assert curve_math.fit_nurbs_control(control, 4, cyclic, not cyclic, bezier=True)[0] == (
+            curve_math.bezier_knot_segments(control, cyclic)
+        )
@@ -0,0 +1,161 @@
+import io
+import json
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Launch_DeliveryKit"))
+
+from splinemaker_project import (
+    MIN_POINT_COUNT, SplineMakerPoint, SplineMakerProject, SplineMakerSpline, changed_live_links, clamp_order,
+    load_project, load_project_data, open_project, project_from_data, save_project, spline_point_count,
+    spline_point_rows, write_project_json,
+)
+
+
+def make_spline():
+    return SplineMakerSpline(points=[SplineMakerPoint(float(i), 0.0, 0.0) for i in range(3)])
+
+
+def test_point_writes_reach_columns():
+    spline = make_spline()
+    spline.points[1].z = 5.0
+    spline.points[-1] = SplineMakerPoint(7.0, 8.0, 9.0, size=0.5, weight=2.0)
+    assert list(spline.z) == [0.0, 5.0, 9.0]
+    assert (spline.x[2], spline.y[2], spline.size[2], spline.weight[2]) == (7.0, 8.0, 0.5, 2.0)
+
+
+def test_point_count_changes_fail_loudly():
+    spline = make_spline()
+    with pytest.raises(AttributeError):
+        spline.points.append(SplineMakerPoint(3.0, 0.0, 0.0))
+    with pytest.raises(IndexError):
+        spline.points[3]
+    spline.points = [*spline.points, SplineMakerPoint(3.0, 0.0, 0.0)]
+    assert list(spline.x) == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_points_accept_a_generator():
+    spline = make_spline()
+    spline.points = (SplineMakerPoint(p.x, p.x * 2.0, 1.0) for p in spline.points)
+    assert list(spline.x) == [0.0, 1.0, 2.0]
+    assert list(spline.y) == [0.0, 2.0, 4.0]
+    assert list(spline.z) == list(spline.weight) == [1.0, 1.0, 1.0]
+    assert len(spline.size) == 3
+
+
+@pytest.mark.parametrize("indent", [None, 4])
+def test_streamed_numbers_split_across_chunks(tmp_path, indent):
+    # Chunk boundaries land inside every number for one of these sizes, "1.5e-1" must not stop at "1.5"
+    path = tmp_path / "project.json"
+    points = [
+        {"x": 1.25, "y": -3e-05, "z": 2500.0, "size": 0.125, "weight": 1.0},
+        {"x": 10, "y": 0.5e1, "z": -7.75, "size": 1e-1, "weight": 2.0e0},
+    ]
+    text = json.dumps({
+        "version": 1,
+        "curve_smoothness": 3.0,
+        "splines": [{"cyclic": False, "order_u": 2, "points": points}],
+        "action_area_sizes": {"left": 1.5e-1, "right": 12.0},
+    }, indent=indent, separators=(",", ":") if indent is None else None)
+    path.write_text(text.replace("2500.0", "2.5E+3").replace("0.15", "1.5e-1"), encoding="utf-8")
+    expected, expected_warnings = load_project(str(path))
+    for chunk_size in range(1, 9):
+        project, splines, warnings = open_project(str(path), stream_threshold=0, chunk_size=chunk_size)
+        project.splines.extend(splines)
+        assert project == expected
+        assert warnings == expected_warnings
+    assert expected.curve_smoothness == 3.0
+    assert expected.action_area_left == 0.15
+    assert list(expected.splines[0].z) == [2500.0, -7.75]
+
+
+def test_changed_live_links_skips_ambiguous_missing_and_unchanged(tmp_path):
+    paths = {}
+    for name in ("changed", "unchanged", "shared"):
+        paths[name] = str(tmp_path / f"{name}.json")
+        with open(paths[name], "w", encoding="utf-8") as handle:
+            handle.write("{}")
+    stamps = {"a": None, "b": os.path.getmtime(paths["unchanged"]), "c": None, "d": None, "e": None}
+    claims = {
+        paths["changed"]: ["a"],
+        paths["unchanged"]: ["b"],
+        paths["shared"]: ["c", "d"],
+        str(tmp_path / "missing.json"): ["e"],
+    }
+    changed = changed_live_links(claims, stamps.get)
+    assert changed == [(paths["changed"], "a", os.path.getmtime(paths["changed"]))]
+
+
+def test_worker_project_data_round_trip(tmp_path):
+    path = str(tmp_path / "project.json")
+    spline = make_spline()
+    spline.cyclic = True
+    spline.order_u = 3
+    save_project(path, SplineMakerProject(project_name="p", curve_smoothness=0.25, splines=[spline]))
+    data = load_project_data(path)
+    assert all(type(value) in (str, int, float) for value in data[0])
+    assert project_from_data(data) == load_project(path)
+
+
+def project_payload(project):
+    # The dict save_project() used to pass to json.dumps
+    return {
+        "version": max(1, int(project.version)),
+        "curve_smoothness": float(project.curve_smoothness),
+        "splines": [
+            {
+                "cyclic": bool(spline.cyclic),
+                "order_u": clamp_order(spline.order_u, spline_point_count(spline)),
+                "points": [
+                    {
+                        "x": float(x),
+                        "y": float(y),
+                        "z": float(z),
+                        "size": max(0.001, float(size)),
+                        "weight": max(0.001, float(weight)),
+                    }
+                    for x, y, z, size, weight in spline_point_rows(spline)
+                ],
+            }
+            for spline in project.splines
+            if spline_point_count(spline) >= MIN_POINT_COUNT
+        ],
+        "action_area_sizes": {
+            "left": max(0.001, float(project.action_area_left)),
+            "right": max(0.001, float(project.action_area_right)),
+        },
+    }
+
+
+def written_json(project, indent):
+    handle = io.StringIO()
+    write_project_json(handle, project, indent)
+    return handle.getvalue()
+
+
+@pytest.mark.parametrize("spline_count", [0, 1, 3])
+def test_write_project_json_matches_json_dumps(spline_count):
+    special = [math.nan, math.inf, -math.inf, -0.0, 1e-300, 1.5e22, 0.1, 7.0]
+    splines = [
+        SplineMakerSpline(
+            columns=(
+                special[i:] + special[:i],
+                [v * 2.0 for v in special],
+                [float(n) for n in range(len(special))],
+                [0.0005, 0.25] * 4,
+                [2.0, 1e-9] * 4,
+            ),
+            cyclic=bool(i % 2),
+            order_u=9,
+        )
+        for i in range(spline_count)
+    ]
+    # Splines under the minimum point count are dropped by both writers
+    splines.append(SplineMakerSpline(columns=([1.0], [1.0], [1.0], [1.0], [1.0])))
+    project = SplineMakerProject(curve_smoothness=math.nan, action_area_left=math.inf, splines=splines)
+    payload = project_payload(project)
+    assert written_json(project, 4) == json.dumps(payload, indent=4)
+    assert written_json(project, None) == json.dumps(payload, separators=(",", ":"))